@@ -19,8 +19,13 @@ class DeckContext:
         keys = self.__deck.key_count()
         # Create a blank black image instead of None to prevent default images from appearing
         blank_image = Image.new('RGB', (512, 512), color='black')
-        for key_no in range(keys):
-            self.set_key_image_native(key_no, blank_image)
+        # Every key gets the same image, so convert it to the deck's native format once
+        native_image = PILHelper.to_native_format(self.__deck, blank_image)
+        # Hold the deck's update lock once for the whole clear instead of
+        # letting other threads interleave writes between keys
+        with self.__deck:
+            for key_no in range(keys):
+                self.set_key_image(key_no, native_image)
 
     def render_image(self, icon_filename):
         return render_key_image(self.__deck, icon_filename)
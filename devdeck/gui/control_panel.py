@@ -9,13 +9,12 @@ Provides a simple GUI interface to:
 
 import json
 import logging
-import queue
 import threading
 import time
 import tkinter as tk
+from collections import deque
 from tkinter import ttk, scrolledtext
 from typing import Optional, List, Dict
-from datetime import datetime
 from pathlib import Path
 
 try:
@@ -23,12 +22,21 @@ try:
 except ImportError:
     mido = None
 
+try:
+    import rtmidi
+except ImportError:
+    rtmidi = None
+
 from devdeck.midi import MidiManager
-from devdeck.usb_device_checker import check_elgato_stream_deck, check_midi_output_device
-from devdeck.gui.key_press_queue import get_queue
+from devdeck.usb_device_checker import scan_usb_once
+from devdeck.gui.key_press_queue import drain as drain_key_presses
 from devdeck.deck_context import DeckContext
 from devdeck.settings.devdeck_settings import DevDeckSettings
 from devdeck.ketron.ketron import KetronMidi
+# devdeck.main only imports the GUI under __main__, so there is no import cycle.
+# main() only adds its logging handlers on the first call, so calling it again
+# for each restart is fine without a reload.
+from devdeck.main import main as devdeck_main
 
 # Try to import deck manager registry for screen clearing
 try:
@@ -39,6 +47,32 @@ except ImportError:
     get_deck_manager = None
 from StreamDeck.DeviceManager import DeviceManager
 
+# Bound once for the MIDI monitor path (per-event producer and per-drain writer)
+_monotonic_ns = time.monotonic_ns
+_strftime = time.strftime
+_localtime = time.localtime
+_END = tk.END
+_NORMAL = tk.NORMAL
+_DISABLED = tk.DISABLED
+
+# Monitor line templates for Stream Deck key presses, with and without the MIDI hex
+_format_key_press_hex = "[{}] Pressed {} [{}]".format
+_format_key_press = "[{}] Pressed {}".format
+
+
+def _text_line_count(widget) -> int:
+    """Number of lines in a Text widget, read from Tk's line index rather than by copying the text"""
+    return int(widget.index("end-1c").split(".")[0])
+
+
+class _MinimalDeckManager:
+    """Just enough of a DeckManager for a DeckContext used to blank a deck"""
+    __slots__ = ('decks', '_deck')
+    
+    def __init__(self, deck):
+        self.decks = ()
+        self._deck = deck
+
 
 class DevDeckControlPanel:
     """Main GUI control panel for EVMDeck application"""
@@ -51,6 +85,23 @@ class DevDeckControlPanel:
         '1a86': 'CH345',
     }
     
+    # Number of most recent lines kept in the MIDI monitor
+    MIDI_MONITOR_MAX_LINES = 50
+    # Let the monitor grow to this many lines before trimming back to MIDI_MONITOR_MAX_LINES
+    MIDI_MONITOR_TRIM_AT = 100
+    
+    # Reuse USB scan results younger than this (seconds)
+    USB_SCAN_CACHE_TTL = 0.5
+    # How often (ms) the Tk thread checks whether a USB scan has finished
+    USB_SCAN_POLL_MS = 50
+    # How often (ms) the Tk thread checks whether shutdown has finished when closing
+    SHUTDOWN_POLL_MS = 50
+    
+    # Seconds to wait for the app thread on stop, and for a stop before restarting
+    # (2s stop timeout + 1s for device release)
+    STOP_TIMEOUT = 2.0
+    RESTART_TIMEOUT = 3.0
+    
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("EVMDeck Control Panel")
@@ -63,25 +114,57 @@ class DevDeckControlPanel:
         self.app_thread: Optional[threading.Thread] = None
         self.app_running = False
         self.app_stop_event = threading.Event()
+        # Set while no application thread holds the Stream Deck
+        self._deck_released = threading.Event()
+        self._deck_released.set()
         self.app_process = None  # For tracking the application process if needed
         
         # MIDI monitoring state
         self.midi_input_thread: Optional[threading.Thread] = None
         self.midi_input_port = None
+        self._raw_midi_in = None  # rtmidi.MidiIn when monitoring via the raw callback
         self.midi_monitoring = False
         self.midi_stop_event = threading.Event()
-        self.midi_message_queue = queue.Queue()
+        # Bounded buffer of monitor lines; single producer (MIDI thread) and
+        # single consumer (Tk loop), so a plain lock is all we need
+        self.midi_message_queue: deque = deque(maxlen=1000)
+        self._mq_lock = threading.Lock()
+        # Monitor entries carry a monotonic_ns stamp; this anchor maps it back to wall-clock time
+        self._wall_anchor = time.time() - time.monotonic_ns() / 1e9
+        self._hms_cache = (None, "")
+        
+        # Config file locations, resolved once
+        # control_panel.py is at: devdeck/gui/control_panel.py, so the
+        # project root is 3 levels up: gui -> devdeck -> project_root
+        self._project_root = Path(__file__).resolve().parents[2]
+        self._settings_path = self._project_root / 'config' / 'settings.yml'
+        self._key_mappings_path = self._project_root / 'config' / 'key_mappings.json'
+        if not self._key_mappings_path.exists():
+            self._key_mappings_path = self._project_root / 'key_mappings.json'
         
         # Stream Deck key press monitoring
-        self.streamdeck_key_queue = get_queue()
         self.key_mappings: Dict[int, str] = {}  # key_no -> key_name
+        self._key_name_cache: Dict[int, str] = {}  # key_no -> display name, reset on reload
         self._load_key_mappings()
         
+        # Set while a Refresh Devices scan is running so clicks can't overlap
+        self._refresh_in_flight = False
+        # Results of the USB scan worker, and the event it sets when it has finished
+        self._usb_scan_results = (None, None)
+        self._usb_scan_done = threading.Event()
+        # Set by the shutdown worker once the window can be destroyed
+        self._shutdown_done = threading.Event()
+        
+        # Last USB scan results; "t" is the time.monotonic() of the scan
+        self._usb_cache = {"t": 0.0, "elgato": None, "midi": None}
+        
         # MIDI manager - lazy initialization to avoid GIL issues
         self._midi_manager = None
-        
-        # Flag to prevent MIDI operations during initialization
-        self._midi_ready = False
+        # Pedal/tab lookup tables for the Start/Stop button; KetronMidi holds no port
+        # (sends go through the MidiManager singleton), so one instance serves every click
+        self._ketron_midi = KetronMidi()
+        # Output port used by the last successful Start/Stop lookup; reset when monitoring stops
+        self._cached_midi_port: Optional[str] = None
         
         # Build UI
         self._build_ui()
@@ -92,17 +175,34 @@ class DevDeckControlPanel:
         # Don't auto-update USB devices on startup to avoid GIL/threading issues
         # User can click "Refresh Devices" button to manually update
         # Set initial placeholder text
-        self.usb_input_label.config(text="Click 'Refresh Devices' to scan", 
-                                    foreground="gray")
-        self.usb_output_label.config(text="Click 'Refresh Devices' to scan", 
-                                     foreground="gray")
-        
-        # Mark MIDI as ready after GUI is fully initialized
-        # Use a longer delay to ensure Python runtime is fully ready
-        self.root.after(500, lambda: setattr(self, '_midi_ready', True))
-        
-        # Start MIDI message processing (defer to avoid blocking initialization)
-        self.root.after(100, self._process_midi_messages)
+        self._set_label(self.usb_input_label, "Click 'Refresh Devices' to scan", "gray")
+        self._set_label(self.usb_output_label, "Click 'Refresh Devices' to scan", "gray")
+        
+        # While the window is minimized, monitor lines are held here instead of
+        # being laid out in the hidden text widget; only the last screenful matters
+        self._midi_visible = False
+        self._pending_midi_lines: deque = deque(maxlen=self.MIDI_MONITOR_MAX_LINES)
+        self.root.bind("<Map>", self._on_root_mapped, add="+")
+        self.root.bind("<Unmap>", self._on_root_unmapped, add="+")
+        
+        # Start MIDI message processing (defer to avoid blocking initialization).
+        # The poll interval adapts to traffic, see _next_poll_interval()
+        self._midi_poll_ms = 100
+        self.root.after(self._midi_poll_ms, self._process_midi_messages)
+    
+    def _on_root_mapped(self, event):
+        """Show monitor lines held while the window was minimized"""
+        if event.widget is self.root:
+            self._midi_visible = True
+            if self._pending_midi_lines:
+                lines = list(self._pending_midi_lines)
+                self._pending_midi_lines.clear()
+                self._write_monitor_lines(lines)
+    
+    def _on_root_unmapped(self, event):
+        """Hold monitor lines while the window is minimized"""
+        if event.widget is self.root:
+            self._midi_visible = False
     
     @property
     def midi_manager(self):
@@ -111,7 +211,7 @@ class DevDeckControlPanel:
             try:
                 self._midi_manager = MidiManager()
             except Exception as e:
-                self.logger.error(f"Failed to initialize MidiManager: {e}", exc_info=True)
+                self.logger.error("Failed to initialize MidiManager: %s", e, exc_info=True)
                 # Return a dummy object that has the methods we need
                 class DummyMidiManager:
                     def get_open_ports(self):
@@ -159,9 +259,9 @@ class DevDeckControlPanel:
         self.start_button.grid(row=0, column=0, padx=5)
         
         # Refresh Devices button centered
-        refresh_button = ttk.Button(button_frame, text="Refresh Devices", 
-                                    command=self._update_usb_devices, width=15)
-        refresh_button.grid(row=0, column=1, padx=5)
+        self.refresh_button = ttk.Button(button_frame, text="Refresh Devices", 
+                                         command=self._update_usb_devices, width=15)
+        self.refresh_button.grid(row=0, column=1, padx=5)
         
         self.exit_button = ttk.Button(button_frame, text="Exit", 
                                      command=self._on_closing, width=12)
@@ -202,6 +302,8 @@ class DevDeckControlPanel:
         self.midi_text = scrolledtext.ScrolledText(monitor_frame, height=3, 
                                                    wrap=tk.WORD, state=tk.DISABLED)
         self.midi_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Lines currently in midi_text, tracked so trimming never has to query the widget
+        self._midi_line_count = 0
     
     def _start_application(self):
         """Start the EVMDeck application in a separate thread"""
@@ -210,16 +312,14 @@ class DevDeckControlPanel:
         
         self.app_running = True
         self.app_stop_event.clear()
+        self._deck_released.clear()
+        self._invalidate_usb_cache()
         
         def run_app():
+            # Final status shown once the thread exits
+            final_status = "Stopped"
             try:
                 self.logger.info("Starting EVMDeck application in background thread...")
-                # Import here to avoid circular import and blocking during GUI init
-                # Use a fresh import to avoid any cached state
-                import importlib
-                main_module = importlib.import_module('devdeck.main')
-                devdeck_main = main_module.main
-                
                 # Note: This will run the main() function
                 # We may need to modify main() to check for stop events
                 devdeck_main()
@@ -234,21 +334,16 @@ class DevDeckControlPanel:
                     self.logger.warning("2. Another application is using the device")
                     self.logger.warning("3. The device needs a moment to be released")
                     # Show user-friendly error in GUI
-                    self.root.after(0, lambda: self._update_status("Error: Device locked", "red"))
-                    self.root.after(0, lambda: self.status_label.config(
-                        text="Status: Error - Device locked (try unplugging/replugging)", 
-                        foreground="red"
-                    ))
+                    final_status = "Error - Device locked (try unplugging/replugging)"
                 else:
-                    self.logger.error(f"Error in application thread: {e}", exc_info=True)
-                    self.root.after(0, lambda: self._update_status("Error", "red"))
+                    self.logger.error("Error in application thread: %s", e, exc_info=True)
+                    final_status = "Error"
             finally:
                 self.app_running = False
-                # Only update status if it's not already set to a specific error
-                current_status = self.status_label.cget("text")
-                if "Error" not in current_status:
-                    self.root.after(0, lambda: self._update_status("Stopped", "red"))
-                self.root.after(0, self._update_buttons)
+                # main() has returned, so it no longer holds the Stream Deck
+                self._deck_released.set()
+                # Status and buttons are updated together in one Tk callback
+                self.root.after(0, self._apply_state, final_status, "red")
         
         self.app_thread = threading.Thread(target=run_app, daemon=True)
         self.app_thread.start()
@@ -256,16 +351,15 @@ class DevDeckControlPanel:
         # Automatically start MIDI monitoring when application starts
         self._start_midi_monitoring()
         
-        self._update_status("Running", "green")
-        self._update_buttons()
+        self._apply_state("Running", "green")
     
     def _stop_application(self):
         """Stop the EVMDeck application"""
         if not self.app_running:
             return
         
-        self._update_status("Stopping...", "orange")
-        self._update_buttons()
+        self._apply_state("Stopping...", "orange")
+        self._invalidate_usb_cache()
         
         # Stop MIDI monitoring when application stops
         self._stop_midi_monitoring()
@@ -276,34 +370,27 @@ class DevDeckControlPanel:
         # Note: The main() function blocks on thread.join() which can't be interrupted
         # We'll wait a short time, then mark as stopped even if thread is still running
         # The thread is daemon=True so it will be killed when GUI exits
-        stop_timeout_ms = 2000  # 2 seconds timeout
-        check_interval = 100  # Check every 100ms
-        max_checks = stop_timeout_ms // check_interval
-        check_count = [0]  # Use list to allow modification in nested function
-        
-        def check_thread():
-            check_count[0] += 1
-            
-            if self.app_thread and self.app_thread.is_alive():
-                if check_count[0] < max_checks:
-                    # Thread still running, check again
-                    self.root.after(check_interval, check_thread)
-                else:
-                    # Timeout reached - thread didn't exit cleanly
-                    # This is expected since main() blocks on join() with no timeout
-                    self.logger.warning("Application thread did not exit within timeout - marking as stopped")
-                    self.app_running = False
-                    self._update_status("Stopped", "red")
-                    self._update_buttons()
-                    self.logger.info("Application marked as stopped (daemon thread will be cleaned up on exit)")
-            else:
-                # Thread finished cleanly
-                self.app_running = False
-                self._update_status("Stopped", "red")
-                self._update_buttons()
-                self.logger.info("Application stopped cleanly")
-        
-        self.root.after(check_interval, check_thread)
+        deadline = time.monotonic() + self.STOP_TIMEOUT
+        self.root.after(100, self._check_stop, deadline)
+    
+    def _check_stop(self, deadline: float):
+        """Poll the application thread until it exits or the stop deadline passes"""
+        if self.app_thread and self.app_thread.is_alive():
+            if time.monotonic() < deadline:
+                # Thread still running, check again
+                self.root.after(100, self._check_stop, deadline)
+                return
+            # Timeout reached - thread didn't exit cleanly
+            # This is expected since main() blocks on join() with no timeout
+            self.logger.warning("Application thread did not exit within timeout - marking as stopped")
+            self.app_running = False
+            self._apply_state("Stopped", "red")
+            self.logger.info("Application marked as stopped (daemon thread will be cleaned up on exit)")
+        else:
+            # Thread finished cleanly
+            self.app_running = False
+            self._apply_state("Stopped", "red")
+            self.logger.info("Application stopped cleanly")
     
     def _restart_application(self):
         """Restart the EVMDeck application"""
@@ -313,40 +400,33 @@ class DevDeckControlPanel:
             
             # Wait for stop to complete, then restart
             # We need to wait for both the stop operation and device release
-            restart_delay_ms = 3000  # 3 seconds total (2s for stop timeout + 1s for device release)
-            check_interval = 200  # Check every 200ms
-            max_checks = restart_delay_ms // check_interval
-            check_count = [0]  # Use list to allow modification in nested function
-            
-            def wait_and_restart():
-                check_count[0] += 1
-                
-                if self.app_running:
-                    # Still stopping, wait a bit more
-                    if check_count[0] < max_checks:
-                        self.root.after(check_interval, wait_and_restart)
-                    else:
-                        # Timeout - force stop and restart anyway
-                        self.logger.warning("Restart timeout - forcing stop and restart")
-                        self.app_running = False
-                        self._update_status("Stopped", "red")
-                        self._update_buttons()
-                        # Wait a moment for device release, then restart
-                        self.logger.info("Waiting for device release before restart...")
-                        self.root.after(1500, lambda: self._start_application())
-                else:
-                    # Stopped, wait a moment for device release, then restart
-                    self.logger.info("Application stopped, waiting for device release before restart...")
-                    self.root.after(1500, lambda: self._start_application())
-            
-            self.root.after(check_interval, wait_and_restart)
+            deadline = time.monotonic() + self.RESTART_TIMEOUT
+            self.root.after(200, self._wait_and_restart, deadline)
         else:
             # Not running, just start it
             self._start_application()
     
+    def _wait_and_restart(self, deadline: float):
+        """Start the application again once the previous run has stopped"""
+        if self.app_running:
+            # Still stopping, wait a bit more
+            if time.monotonic() < deadline:
+                self.root.after(200, self._wait_and_restart, deadline)
+                return
+            # Timeout - force stop and restart anyway
+            self.logger.warning("Restart timeout - forcing stop and restart")
+            self.app_running = False
+            self._apply_state("Stopped", "red")
+            # Wait a moment for device release, then restart
+            self.logger.info("Waiting for device release before restart...")
+        else:
+            # Stopped, wait a moment for device release, then restart
+            self.logger.info("Application stopped, waiting for device release before restart...")
+        self.root.after(1500, self._start_application)
+    
     def _update_status(self, status: str, color: str):
         """Update the status label"""
-        self.status_label.config(text=f"Status: {status}", foreground=color)
+        self._set_label(self.status_label, f"Status: {status}", color)
     
     def _update_buttons(self):
         """Update button states based on application state"""
@@ -355,6 +435,11 @@ class DevDeckControlPanel:
         else:
             self.start_button.config(state=tk.NORMAL)
     
+    def _apply_state(self, status: str, color: str):
+        """Update the status label and button states in a single Tk callback"""
+        self._update_status(status, color)
+        self._update_buttons()
+    
     def _safe_midi_call(self, func, default=None):
         """
         Safely execute a MIDI-related function, handling GIL/threading issues.
@@ -375,13 +460,13 @@ class DevDeckControlPanel:
         except (RuntimeError, SystemError) as e:
             error_msg = str(e).lower()
             if "gil" in error_msg or "thread" in error_msg or "null" in error_msg:
-                self.logger.warning(f"MIDI operation failed due to threading/GIL issue: {e}")
+                self.logger.warning("MIDI operation failed due to threading/GIL issue: %s", e)
             else:
-                self.logger.error(f"MIDI operation failed: {e}")
+                self.logger.error("MIDI operation failed: %s", e)
             return default
         except Exception as e:
             # Catch any other exceptions
-            self.logger.error(f"MIDI operation error: {e}")
+            self.logger.error("MIDI operation error: %s", e)
             return default
     
     def _get_vendor_name(self, vendor_id: str) -> str:
@@ -436,19 +521,35 @@ class DevDeckControlPanel:
     
     def _update_usb_devices(self):
         """Update the displayed USB input and output devices, and refresh key mappings"""
-        # Update UI to show we're scanning
-        self.usb_input_label.config(text="Scanning...", foreground="gray")
-        self.usb_output_label.config(text="Scanning...", foreground="gray")
-        self.root.update_idletasks()  # Force UI update
+        # Only one scan at a time - rapid clicks would otherwise queue
+        # overlapping USB enumerations
+        if self._refresh_in_flight:
+            return
+        self._refresh_in_flight = True
+        self.refresh_button.config(state=tk.DISABLED)
+        
+        # First, refresh key mappings from key_mappings.json (same as on startup).
+        # This stays on the Tk thread, which is the only one reading key_mappings
+        self._refresh_key_mappings()
+        
+        # Reuse a very recent scan if there is one
+        if time.monotonic() - self._usb_cache["t"] < self.USB_SCAN_CACHE_TTL:
+            self._apply_usb_scan_results(self._usb_cache["elgato"], self._usb_cache["midi"])
+            return
         
-        # First, refresh key mappings from key_mappings.json (same as on startup)
+        # Enumerate USB devices in the background so the GUI stays responsive;
+        # _poll_usb_scan picks the results up on the Tk thread
+        self._usb_scan_results = (None, None)
+        self._usb_scan_done.clear()
+        threading.Thread(target=self._scan_usb_devices, daemon=True).start()
+        self.root.after(self.USB_SCAN_POLL_MS, self._poll_usb_scan)
+    
+    def _refresh_key_mappings(self):
+        """Update settings.yml from key_mappings.json and reload the key names shown in the monitor"""
         try:
-            # Find settings.yml file path (same logic as main())
-            # control_panel.py is at: devdeck/gui/control_panel.py
-            # Project root is 3 levels up: gui -> devdeck -> project_root
-            project_root = Path(__file__).parent.parent.parent
-            config_dir = project_root / 'config'
-            settings_filename = config_dir / 'settings.yml'
+            # settings.yml may be generated by main() after the GUI starts,
+            # so its existence is still checked per refresh
+            settings_filename = self._settings_path
             
             if settings_filename.exists():
                 # Update settings.yml from key_mappings.json
@@ -460,54 +561,82 @@ class DevDeckControlPanel:
                 else:
                     self.logger.debug("Key mappings file not found or empty, skipping update")
             else:
-                self.logger.warning(f"Settings file not found: {settings_filename}, skipping key mappings update")
+                self.logger.warning("Settings file not found: %s, skipping key mappings update", settings_filename)
         except Exception as e:
             # Log error but don't fail - continue with USB device refresh
-            self.logger.warning(f"Error updating key mappings: {e}", exc_info=True)
-        
-        # Now refresh USB devices (existing functionality)
+            self.logger.warning("Error updating key mappings: %s", e, exc_info=True)
+    
+    def _scan_usb_devices(self):
+        """Scan USB devices (runs in a worker thread, touching no Tk state)"""
+        # The done event is always set, even if the scan raises, so the in-flight
+        # flag is cleared and the Refresh Devices button comes back
         try:
-            # Check for Elgato Stream Deck (USB Input Device)
-            elgato_connected, elgato_device = check_elgato_stream_deck()
+            self._usb_scan_results = scan_usb_once()
+        except Exception as e:
+            self.logger.error("Error updating USB devices: %s", e, exc_info=True)
+        finally:
+            self._usb_scan_done.set()
+    
+    def _poll_usb_scan(self):
+        """Wait on the Tk thread for the USB scan worker, then show its results"""
+        if not self._usb_scan_done.is_set():
+            self.root.after(self.USB_SCAN_POLL_MS, self._poll_usb_scan)
+            return
+        elgato_result, midi_result = self._usb_scan_results
+        if elgato_result is not None and midi_result is not None:
+            self._usb_cache.update(t=time.monotonic(), elgato=elgato_result, midi=midi_result)
+        self._apply_usb_scan_results(elgato_result, midi_result)
+    
+    @staticmethod
+    def _set_label(label, text: str, color: str):
+        """Configure a label only when its text or color actually changes"""
+        if label.cget('text') != text or str(label.cget('foreground')) != color:
+            label.config(text=text, foreground=color)
+    
+    def _invalidate_usb_cache(self):
+        """Force the next Refresh Devices to rescan (device state may change)"""
+        self._usb_cache["t"] = 0.0
+    
+    def _apply_usb_scan_results(self, elgato_result, midi_result):
+        """Show USB scan results and re-enable the Refresh Devices button"""
+        try:
+            if elgato_result is None or midi_result is None:
+                self._set_label(self.usb_input_label, "Error: Click to retry", "red")
+                self._set_label(self.usb_output_label, "Error: Click to retry", "red")
+                return
+            
+            # Elgato Stream Deck (USB Input Device)
+            elgato_connected, elgato_device = elgato_result
             
             if elgato_connected:
                 if elgato_device:
                     # Show vendor name and device description
                     device_text = self._format_device_display(elgato_device)
-                    self.usb_input_label.config(text=device_text, foreground="green")
+                    self._set_label(self.usb_input_label, device_text, "green")
                 else:
                     # Windows - device detected but no USB info available
                     # Use vendor lookup for Elgato (0fd9)
                     vendor_name = self._get_vendor_name('0fd9')
-                    self.usb_input_label.config(text=f"{vendor_name} - Stream Deck (detected)", 
-                                               foreground="green")
+                    self._set_label(self.usb_input_label, f"{vendor_name} - Stream Deck (detected)", "green")
             else:
-                self.usb_input_label.config(text="Not detected", 
-                                           foreground="red")
+                self._set_label(self.usb_input_label, "Not detected", "red")
             
-            # Check for MIDI output USB device
-            midi_connected, midi_device = check_midi_output_device()
+            # MIDI output USB device
+            midi_connected, midi_device = midi_result
             
             if midi_connected:
                 if midi_device:
                     # Show vendor name and device description
                     device_text = self._format_device_display(midi_device)
-                    self.usb_output_label.config(text=device_text, foreground="green")
+                    self._set_label(self.usb_output_label, device_text, "green")
                 else:
                     # Windows - device detected but no USB info available
-                    self.usb_output_label.config(text="MIDI Output Device (detected)", 
-                                                foreground="green")
+                    self._set_label(self.usb_output_label, "MIDI Output Device (detected)", "green")
             else:
-                self.usb_output_label.config(text="Not detected", 
-                                            foreground="red")
-                
-        except Exception as e:
-            # Catch any exceptions
-            self.logger.error(f"Error updating USB devices: {e}", exc_info=True)
-            self.usb_input_label.config(text="Error: Click to retry", 
-                                       foreground="red")
-            self.usb_output_label.config(text="Error: Click to retry", 
-                                         foreground="red")
+                self._set_label(self.usb_output_label, "Not detected", "red")
+        finally:
+            self._refresh_in_flight = False
+            self.refresh_button.config(state=tk.NORMAL)
     
     def _start_midi_monitoring(self):
         """Start monitoring MIDI input"""
@@ -528,17 +657,31 @@ class DevDeckControlPanel:
             
             # Use the first available input port
             port_name = input_ports[0]
+            self.midi_stop_event.clear()
+            
+            # Prefer rtmidi's raw callback, which hands over the message bytes
+            # without building a mido.Message per event
+            if rtmidi is not None:
+                self._raw_midi_in = self._safe_midi_call(
+                    lambda: self._open_raw_midi_input(port_name),
+                    default=None
+                )
+                if self._raw_midi_in is not None:
+                    self.midi_monitoring = True
+                    self.logger.info("Started MIDI monitoring on port: %s", port_name)
+                    self._post_midi_message('status', ("EVM Deck application ready",))
+                    return
+            
             self.midi_input_port = self._safe_midi_call(
                 lambda: mido.open_input(port_name), 
                 default=None
             )
             
             if self.midi_input_port is None:
-                self.logger.error(f"Failed to open MIDI input port {port_name}")
+                self.logger.error("Failed to open MIDI input port %s", port_name)
                 return
             
             self.midi_monitoring = True
-            self.midi_stop_event.clear()
             
             def monitor_midi():
                 """Thread function to monitor MIDI messages"""
@@ -548,29 +691,24 @@ class DevDeckControlPanel:
                             break
                         
                         # Only log note on/off messages (key presses)
-                        if msg.type in ('note_on', 'note_off'):
-                            timestamp = datetime.now().strftime("%H:%M:%S")
-                            if msg.type == 'note_on' and msg.velocity > 0:
-                                key_info = f"[{timestamp}] Note ON: Note={msg.note}, Velocity={msg.velocity}, Channel={msg.channel + 1}"
-                            else:
-                                key_info = f"[{timestamp}] Note OFF: Note={msg.note}, Channel={msg.channel + 1}"
-                            
-                            self.midi_message_queue.put(key_info)
+                        if msg.type == 'note_on' and msg.velocity > 0:
+                            self._post_midi_message('note_on', (msg.note, msg.velocity, msg.channel))
+                        elif msg.type in ('note_on', 'note_off'):
+                            self._post_midi_message('note_off', (msg.note, msg.channel))
                 except Exception as e:
                     if not self.midi_stop_event.is_set():
-                        self.logger.error(f"Error in MIDI monitoring thread: {e}")
+                        self.logger.error("Error in MIDI monitoring thread: %s", e)
             
             self.midi_input_thread = threading.Thread(target=monitor_midi, daemon=True)
             self.midi_input_thread.start()
             
-            self.logger.info(f"Started MIDI monitoring on port: {port_name}")
+            self.logger.info("Started MIDI monitoring on port: %s", port_name)
             
             # Add status message to monitor
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.midi_message_queue.put(f"[{timestamp}] EVM Deck application ready")
+            self._post_midi_message('status', ("EVM Deck application ready",))
             
         except Exception as e:
-            self.logger.error(f"Error starting MIDI monitoring: {e}")
+            self.logger.error("Error starting MIDI monitoring: %s", e)
             self.midi_monitoring = False
     
     def _stop_midi_monitoring(self):
@@ -580,6 +718,15 @@ class DevDeckControlPanel:
         
         self.midi_monitoring = False
         self.midi_stop_event.set()
+        self._cached_midi_port = None
+        
+        if self._raw_midi_in is not None:
+            try:
+                self._raw_midi_in.cancel_callback()
+                self._raw_midi_in.close_port()
+            except Exception:
+                pass
+            self._raw_midi_in = None
         
         if self.midi_input_port:
             try:
@@ -591,141 +738,236 @@ class DevDeckControlPanel:
         self.logger.info("Stopped MIDI monitoring")
         
         # Add status message to monitor
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.midi_message_queue.put(f"[{timestamp}] MIDI monitoring stopped")
+        self._post_midi_message('status', ("MIDI monitoring stopped",))
+    
+    def _open_raw_midi_input(self, port_name: str):
+        """Open port_name with rtmidi and route incoming messages to _on_raw_midi"""
+        midi_in = rtmidi.MidiIn()
+        try:
+            ports = midi_in.get_ports()
+            if port_name not in ports:
+                midi_in.delete()
+                return None
+            midi_in.open_port(ports.index(port_name))
+            midi_in.set_callback(self._on_raw_midi)
+        except Exception:
+            # Release the rtmidi client; _safe_midi_call logs the error and
+            # monitoring falls back to mido
+            midi_in.delete()
+            raise
+        return midi_in
+    
+    def _on_raw_midi(self, event, _data=None):
+        """rtmidi input callback (runs on rtmidi's thread); only note on/off is shown"""
+        message, _delta = event
+        if len(message) < 3:
+            return
+        status = message[0] & 0xF0
+        channel = message[0] & 0x0F
+        if status == 0x90 and message[2] > 0:
+            self._post_midi_message('note_on', (message[1], message[2], channel))
+        elif status == 0x80 or status == 0x90:
+            self._post_midi_message('note_off', (message[1], channel))
+    
+    def _post_midi_message(self, kind: str, payload: tuple):
+        """Append a raw monitor entry stamped at arrival; safe to call from any thread"""
+        with self._mq_lock:
+            self.midi_message_queue.append((_monotonic_ns(), kind, payload))
+    
+    def _drain_midi_messages(self) -> List[tuple]:
+        """Take all pending monitor messages in a single lock acquisition"""
+        with self._mq_lock:
+            messages = list(self.midi_message_queue)
+            self.midi_message_queue.clear()
+        return messages
     
     def _load_key_mappings(self):
         """Load key mappings from key_mappings.json"""
+        key_mappings_file = self._key_mappings_path
         try:
-            # Try to find key_mappings.json in config directory
-            project_root = Path(__file__).parent.parent.parent
-            key_mappings_file = project_root / 'config' / 'key_mappings.json'
-            
-            if not key_mappings_file.exists():
-                key_mappings_file = project_root / 'key_mappings.json'
-            
-            if key_mappings_file.exists():
+            try:
                 with open(key_mappings_file, 'r', encoding='utf-8') as f:
                     content = f.read()
-                
-                # Try UTF-16 first, then UTF-8
-                try:
-                    key_mappings_data = json.loads(content)
-                except json.JSONDecodeError:
-                    with open(key_mappings_file, 'r', encoding='utf-16') as f:
-                        content = f.read()
-                    key_mappings_data = json.loads(content)
-                
-                # Handle both named structure {"key_mappings": [...]} and direct array [...]
-                if isinstance(key_mappings_data, dict) and 'key_mappings' in key_mappings_data:
-                    key_mappings = key_mappings_data['key_mappings']
-                elif isinstance(key_mappings_data, list):
-                    key_mappings = key_mappings_data
-                else:
-                    key_mappings = []
-                
-                # Create mapping: key_no -> key_name
-                self.key_mappings = {
-                    mapping['key_no']: mapping.get('key_name', '').strip()
-                    for mapping in key_mappings
-                    if 'key_no' in mapping
-                }
-                self.logger.info(f"Loaded {len(self.key_mappings)} key mappings")
+            except FileNotFoundError:
+                self.logger.warning("Key mappings file not found: %s", key_mappings_file)
+                return
+            
+            # Try UTF-8 first, then UTF-16
+            try:
+                key_mappings_data = json.loads(content)
+            except json.JSONDecodeError:
+                with open(key_mappings_file, 'r', encoding='utf-16') as f:
+                    content = f.read()
+                key_mappings_data = json.loads(content)
+            
+            # Handle both named structure {"key_mappings": [...]} and direct array [...]
+            if isinstance(key_mappings_data, dict) and 'key_mappings' in key_mappings_data:
+                key_mappings = key_mappings_data['key_mappings']
+            elif isinstance(key_mappings_data, list):
+                key_mappings = key_mappings_data
             else:
-                self.logger.warning(f"Key mappings file not found: {key_mappings_file}")
+                key_mappings = []
+            
+            # Create mapping: key_no -> key_name
+            self.key_mappings = {
+                mapping['key_no']: mapping.get('key_name', '').strip()
+                for mapping in key_mappings
+                if 'key_no' in mapping
+            }
+            self._key_name_cache.clear()
+            self.logger.info("Loaded %d key mappings", len(self.key_mappings))
         except Exception as e:
-            self.logger.error(f"Error loading key mappings: {e}", exc_info=True)
+            self.logger.error("Error loading key mappings: %s", e, exc_info=True)
+    
+    def _fmt_hms(self, ns_timestamp: int) -> str:
+        """Format a monotonic_ns stamp as wall-clock HH:MM:SS, reusing the last result within a second"""
+        second = int(self._wall_anchor + ns_timestamp / 1e9)
+        if second != self._hms_cache[0]:
+            self._hms_cache = (second, _strftime("%H:%M:%S", _localtime(second)))
+        return self._hms_cache[1]
+    
+    def _format_midi_message(self, ns_timestamp: int, kind: str, payload: tuple) -> str:
+        """Render a monitor entry queued by _post_midi_message"""
+        timestamp = self._fmt_hms(ns_timestamp)
+        if kind == 'note_on':
+            note, velocity, channel = payload
+            return f"[{timestamp}] Note ON: Note={note}, Velocity={velocity}, Channel={channel + 1}"
+        if kind == 'note_off':
+            note, channel = payload
+            return f"[{timestamp}] Note OFF: Note={note}, Channel={channel + 1}"
+        return f"[{timestamp}] {payload[0]}"
     
     def _get_key_name(self, key_no: int) -> str:
         """Get key name from key number"""
-        return self.key_mappings.get(key_no, f"Key {key_no}")
+        name = self._key_name_cache.get(key_no)
+        if name is None:
+            name = self.key_mappings.get(key_no, f"Key {key_no}")
+            self._key_name_cache[key_no] = name
+        return name
     
     def _process_midi_messages(self):
         """Process MIDI messages and Stream Deck key presses from queues and update the text widget"""
+        lines = []
         try:
             # Process MIDI messages
-            while True:
-                try:
-                    message = self.midi_message_queue.get_nowait()
-                    self._add_midi_message(message)
-                except queue.Empty:
-                    break
+            lines = [
+                self._format_midi_message(ns_timestamp, kind, payload)
+                for ns_timestamp, kind, payload in self._drain_midi_messages()
+            ]
             
             # Process Stream Deck key presses
-            while True:
-                try:
-                    # Handle both old format (key_no, key_name) and new format (key_no, key_name, midi_hex)
-                    item = self.streamdeck_key_queue.get_nowait()
-                    if len(item) == 2:
-                        key_no, key_name = item
-                        midi_hex = None
-                    else:
-                        key_no, key_name, midi_hex = item
-                    
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    
-                    # Use provided key_name or look it up
-                    if key_name:
-                        display_name = key_name
-                    else:
-                        display_name = self._get_key_name(key_no)
-                    
-                    # Format message with MIDI hex if available (wrapped in square brackets)
-                    if midi_hex:
-                        key_info = f"[{timestamp}] Pressed {display_name} [{midi_hex}]"
-                    else:
-                        key_info = f"[{timestamp}] Pressed {display_name}"
-                    self._add_midi_message(key_info)
-                except queue.Empty:
-                    break
+            items = drain_key_presses()
+            
+            if items:
+                # One second-resolution stamp is shared by the whole batch
+                timestamp = self._fmt_hms(_monotonic_ns())
+                get_key_name = self._get_key_name
+                # Use provided key_name or look it up; add MIDI hex if available (wrapped in square brackets)
+                lines.extend(
+                    _format_key_press_hex(timestamp, key_name or get_key_name(key_no), midi_hex) if midi_hex
+                    else _format_key_press(timestamp, key_name or get_key_name(key_no))
+                    for key_no, key_name, midi_hex in items
+                )
+            
+            if lines:
+                if self._midi_visible:
+                    self._write_monitor_lines(lines)
+                else:
+                    self._pending_midi_lines.extend(lines)
         except Exception as e:
-            self.logger.error(f"Error processing messages: {e}")
+            self.logger.error("Error processing messages: %s", e)
         
         # Schedule next check
-        self.root.after(100, self._process_midi_messages)
+        self._midi_poll_ms = self._next_poll_interval(len(lines))
+        self.root.after(self._midi_poll_ms, self._process_midi_messages)
     
-    def _add_midi_message(self, message: str):
-        """Add a MIDI message to the text widget"""
-        self.midi_text.config(state=tk.NORMAL)
-        
-        # Insert new message at the end
-        self.midi_text.insert(tk.END, message + "\n")
-        
-        # Keep only the last ~50 lines (approximately 3 visible rows worth)
-        lines = self.midi_text.get("1.0", tk.END).split("\n")
-        if len(lines) > 50:
-            self.midi_text.delete("1.0", f"{len(lines) - 50}.0")
-        
-        # Scroll to bottom
-        self.midi_text.see(tk.END)
-        self.midi_text.config(state=tk.DISABLED)
+    def _next_poll_interval(self, drained: int) -> int:
+        """Poll slowly when idle and about once per frame during a burst"""
+        if not drained:
+            return min(200, self._midi_poll_ms * 2)
+        if drained >= 8:
+            return 16
+        return 50
+    
+    def _write_monitor_lines(self, lines: List[str]):
+        """Add lines to the monitor widget and scroll to the newest one"""
+        self.midi_text.config(state=_NORMAL)
+        self._append_lines_no_scroll(lines)
+        self.midi_text.config(state=_DISABLED)
+        self._flush_scroll()
+    
+    def _append_lines_no_scroll(self, lines: List[str]):
+        """Append a batch of lines to the monitor with a single insert and trim (widget must be NORMAL)"""
+        self.midi_text.insert(_END, "\n".join(lines) + "\n")
+        self._midi_line_count += len(lines)
+        self._trim_midi_text()
+    
+    def _flush_scroll(self):
+        """Scroll the monitor to the newest line; called once per drain"""
+        self.midi_text.see(_END)
+    
+    def _trim_midi_text(self):
+        """Trim the monitor back to MIDI_MONITOR_MAX_LINES once it passes MIDI_MONITOR_TRIM_AT (widget must be NORMAL)"""
+        if self._midi_line_count > self.MIDI_MONITOR_TRIM_AT:
+            # Re-sync the tracked count with the widget once per trim; every line ends
+            # with a newline, so the last index line is always empty
+            self._midi_line_count = _text_line_count(self.midi_text) - 1
+            excess = self._midi_line_count - self.MIDI_MONITOR_MAX_LINES
+            if excess > 0:
+                self.midi_text.delete("1.0", f"{excess + 1}.0")
+                self._midi_line_count -= excess
     
     def _on_closing(self):
         """Handle window close event"""
         self._stop_midi_monitoring()
         
-        # Clear the screen BEFORE stopping the application (while deck is still open)
-        # This ensures we can clear it even if the app thread doesn't exit cleanly
-        if self.app_running:
-            self.logger.info("Application is running, clearing screen before stopping...")
-            self._clear_stream_deck_screen_while_open()
-        
-        # Stop the application - this will also clear the screen via DeckManager.close()
-        # but we've already cleared it above as a safety measure
-        self._stop_application()
-        
-        # Try to clear screen as final fallback (in case app wasn't running or clear failed)
-        if not self.app_running:
-            self._clear_stream_deck_screen()
-        
-        self.root.destroy()
+        # Hide the window right away; clearing the Stream Deck is HID I/O
+        # and runs on a worker so Tk never blocks on it
+        self.root.withdraw()
+        threading.Thread(target=self._shutdown_worker, args=(self.app_running,), daemon=True).start()
+        # The worker only sets an event; Tk is polled and destroyed from its own thread
+        self.root.after(self.SHUTDOWN_POLL_MS, self._poll_shutdown)
+    
+    def _poll_shutdown(self):
+        """Destroy the window once the shutdown worker has finished"""
+        if self._shutdown_done.is_set():
+            self.root.destroy()
+        else:
+            self.root.after(self.SHUTDOWN_POLL_MS, self._poll_shutdown)
+    
+    def _shutdown_worker(self, was_running: bool):
+        """Clear the Stream Deck and stop the application (runs in a worker thread, touching no Tk state)"""
+        try:
+            cleared = False
+            if was_running:
+                # Clear the screen BEFORE stopping the application (while deck is still open)
+                # This ensures we can clear it even if the app thread doesn't exit cleanly
+                self.logger.info("Application is running, clearing screen before stopping...")
+                cleared = self._clear_stream_deck_screen_while_open()
+                
+                # Stop the application - DeckManager.close() also clears the screen.
+                # The status/button updates of _stop_application are skipped since the
+                # window is going away; the daemon thread ends with the process
+                self.app_stop_event.set()
+            
+            # Fall back to opening the deck ourselves only if it wasn't cleared above
+            if not cleared:
+                self._clear_stream_deck_screen()
+            
+            # Let a Start/Stop key release scheduled by the GUI button go out
+            self._ketron_midi.flush()
+        finally:
+            self._shutdown_done.set()
     
-    def _clear_stream_deck_screen_while_open(self):
+    def _clear_stream_deck_screen_while_open(self) -> bool:
         """
         Clear the Stream Deck screen while the application is still running.
         
         This uses the registered DeckManager to clear the screen using the
         already-open deck.
+        
+        Returns:
+            True if the screen was cleared
         """
         try:
             self.logger.info("Attempting to clear Stream Deck screen (deck should be open)...")
@@ -737,7 +979,7 @@ class DevDeckControlPanel:
                     try:
                         deck_manager.clear_screen()
                         self.logger.info("Stream Deck screen cleared successfully via DeckManager")
-                        return
+                        return True
                     except Exception as ex:
                         self.logger.warning("Error clearing screen via DeckManager: %s", ex)
             
@@ -747,44 +989,28 @@ class DevDeckControlPanel:
             
             if not streamdecks:
                 self.logger.debug("No Stream Deck detected for screen clear")
-                return
+                return False
             
             # Try to clear each detected deck
             for deck in streamdecks:
                 try:
                     # Try to use the deck directly (it should be open)
                     try:
-                        keys = deck.key_count()
-                        
-                        # Create a minimal deck manager-like object for DeckContext
-                        class MinimalDeckManager:
-                            def __init__(self, deck):
-                                self.decks = []
-                                self._deck = deck
-                        
-                        minimal_manager = MinimalDeckManager(deck)
-                        context = DeckContext(minimal_manager, deck)
+                        context = DeckContext(_MinimalDeckManager(deck), deck)
                         
                         # Clear all keys to black
-                        for key_no in range(keys):
-                            with context.renderer(key_no) as r:
-                                r.background_color('black')
-                                r.text('')\
-                                    .font_size(100)\
-                                    .color('black')\
-                                    .center_vertically()\
-                                    .center_horizontally()\
-                                    .end()
+                        context.reset_deck()
                         
                         self.logger.info("Stream Deck screen cleared successfully (direct access)")
-                        return
+                        return True
                     except Exception as ex:
-                        self.logger.debug(f"Could not access deck directly: {ex}")
+                        self.logger.debug("Could not access deck directly: %s", ex)
                         # Can't access the open deck, that's okay - DeckManager.close() will handle it
                 except Exception as ex:
                     self.logger.warning("Error clearing Stream Deck screen while open: %s", ex)
         except Exception as ex:
             self.logger.warning("Failed to clear Stream Deck screen while open: %s", ex)
+        return False
     
     def _send_start_stop(self):
         """
@@ -795,35 +1021,22 @@ class DevDeckControlPanel:
         try:
             self.logger.info("Start/Stop button pressed in GUI")
             
-            # Get MIDI port name from MidiManager
-            port_name = None
-            try:
-                # Use lazy-initialized midi_manager
-                midi_mgr = self.midi_manager
-                
-                # Get open ports
-                open_ports = midi_mgr.get_open_ports()
-                if open_ports:
-                    port_name = open_ports[0]
-                    self.logger.info(f"Using open MIDI port: {port_name}")
-                else:
-                    # Try to auto-connect to hardware port
-                    self.logger.debug("No open ports, attempting to auto-connect...")
-                    if midi_mgr.auto_connect_hardware_port():
-                        open_ports = midi_mgr.get_open_ports()
-                        if open_ports:
-                            port_name = open_ports[0]
-                            self.logger.info(f"Auto-connected to MIDI port: {port_name}")
-                        else:
-                            self.logger.warning("Auto-connect reported success but no ports are open")
-                    else:
-                        self.logger.warning("Failed to auto-connect to MIDI hardware port")
-            except Exception as e:
-                self.logger.warning(f"Error getting MIDI port: {e}", exc_info=True)
+            # Use the port that worked last time; only enumerate when there isn't one
+            port_name = self._cached_midi_port
+            from_cache = port_name is not None
+            if not from_cache:
+                port_name = self._resolve_midi_port()
+            
+            # Send Start/Stop command
+            success = self._ketron_midi.send_pedal_command("Start/Stop", port_name)
             
-            # Create KetronMidi instance and send Start/Stop command
-            ketron_midi = KetronMidi()
-            success = ketron_midi.send_pedal_command("Start/Stop", port_name)
+            if not success and from_cache:
+                # The cached port may have gone away - rescan once and retry
+                self.logger.debug("Send on cached port %s failed, rescanning MIDI ports", port_name)
+                self._cached_midi_port = None
+                port_name = self._resolve_midi_port()
+                if port_name is not None:
+                    success = self._ketron_midi.send_pedal_command("Start/Stop", port_name)
             
             if success:
                 self.logger.info("Start/Stop MIDI command sent successfully")
@@ -831,7 +1044,37 @@ class DevDeckControlPanel:
                 self.logger.error("Failed to send Start/Stop MIDI command")
                 
         except Exception as e:
-            self.logger.error(f"Error sending Start/Stop command: {e}", exc_info=True)
+            self.logger.error("Error sending Start/Stop command: %s", e, exc_info=True)
+    
+    def _resolve_midi_port(self) -> Optional[str]:
+        """Find (or auto-connect) an open MIDI output port and remember it for later sends"""
+        port_name = None
+        try:
+            # Use lazy-initialized midi_manager
+            midi_mgr = self.midi_manager
+            
+            # Get open ports
+            open_ports = midi_mgr.get_open_ports()
+            if open_ports:
+                port_name = open_ports[0]
+                self.logger.info("Using open MIDI port: %s", port_name)
+            else:
+                # Try to auto-connect to hardware port
+                self.logger.debug("No open ports, attempting to auto-connect...")
+                if midi_mgr.auto_connect_hardware_port():
+                    open_ports = midi_mgr.get_open_ports()
+                    if open_ports:
+                        port_name = open_ports[0]
+                        self.logger.info("Auto-connected to MIDI port: %s", port_name)
+                    else:
+                        self.logger.warning("Auto-connect reported success but no ports are open")
+                else:
+                    self.logger.warning("Failed to auto-connect to MIDI hardware port")
+        except Exception as e:
+            self.logger.warning("Error getting MIDI port: %s", e, exc_info=True)
+        
+        self._cached_midi_port = port_name
+        return port_name
     
     def _clear_stream_deck_screen(self):
         """
@@ -842,9 +1085,9 @@ class DevDeckControlPanel:
         try:
             self.logger.info("Clearing Stream Deck screen on exit...")
             
-            # Wait a short moment for the device to be released after stopping the application
+            # Wait (briefly) for the application thread to release the device
             # This helps avoid "No HID device" errors
-            time.sleep(0.5)
+            self._deck_released.wait(timeout=0.5)
             
             # Access Stream Deck using DeviceManager (similar to main())
             streamdecks = DeviceManager().enumerate()
@@ -856,8 +1099,13 @@ class DevDeckControlPanel:
             # Clear each detected deck with retry logic
             for deck in streamdecks:
                 deck_opened = False
-                max_retries = 3
-                retry_delay = 0.3
+                # Back off 50ms, 100ms, 200ms, 400ms - about the same total wait
+                # as the old 3 x 300ms, but a quickly released device is retried sooner
+                max_retries = 5
+                retry_delay = 0.05
+                # Only the deck reference is needed, not a full DeckManager;
+                # the same context serves every retry
+                context = DeckContext(_MinimalDeckManager(deck), deck)
                 
                 for attempt in range(max_retries):
                     try:
@@ -870,38 +1118,20 @@ class DevDeckControlPanel:
                             if "hid device" in error_msg or "could not open" in error_msg:
                                 if attempt < max_retries - 1:
                                     # Wait and retry
-                                    self.logger.debug(f"Device not ready, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})...")
+                                    self.logger.debug("Device not ready, retrying in %ss (attempt %s/%s)...", retry_delay, attempt + 1, max_retries)
                                     time.sleep(retry_delay)
+                                    retry_delay = min(retry_delay * 2, 0.5)
                                     continue
                                 else:
                                     # Last attempt failed, log and skip
-                                    self.logger.warning(f"Could not open Stream Deck after {max_retries} attempts: {open_ex}")
+                                    self.logger.warning("Could not open Stream Deck after %s attempts: %s", max_retries, open_ex)
                                     return
                             else:
                                 # Different error, might be already open, try to use it anyway
                                 self.logger.debug("Deck might already be open, attempting to clear anyway")
                         
-                        # Create a minimal deck manager-like object for DeckContext
-                        # We only need the deck reference, not a full DeckManager
-                        class MinimalDeckManager:
-                            def __init__(self, deck):
-                                self.decks = []
-                                self._deck = deck
-                        
-                        minimal_manager = MinimalDeckManager(deck)
-                        context = DeckContext(minimal_manager, deck)
-                        
                         # Clear all keys to black
-                        keys = deck.key_count()
-                        for key_no in range(keys):
-                            with context.renderer(key_no) as r:
-                                r.background_color('black')
-                                r.text('')\
-                                    .font_size(100)\
-                                    .color('black')\
-                                    .center_vertically()\
-                                    .center_horizontally()\
-                                    .end()
+                        context.reset_deck()
                         
                         self.logger.info("Stream Deck screen cleared successfully")
                         
@@ -916,8 +1146,9 @@ class DevDeckControlPanel:
                         error_msg = str(ex).lower()
                         if ("hid device" in error_msg or "could not open" in error_msg) and attempt < max_retries - 1:
                             # Retry on HID device errors
-                            self.logger.debug(f"Error accessing device, retrying in {retry_delay}s (attempt {attempt + 1}/{max_retries})...")
+                            self.logger.debug("Error accessing device, retrying in %ss (attempt %s/%s)...", retry_delay, attempt + 1, max_retries)
                             time.sleep(retry_delay)
+                            retry_delay = min(retry_delay * 2, 0.5)
                             continue
                         else:
                             # Other error or last attempt
@@ -954,7 +1185,7 @@ def run_gui():
     except KeyboardInterrupt:
         logger.info("GUI interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error starting GUI: {e}", exc_info=True)
+        logger.error("Fatal error starting GUI: %s", e, exc_info=True)
         print(f"Fatal error starting GUI: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc()
@@ -3,33 +3,28 @@ Registry for accessing the active DeckManager from the GUI.
 
 This allows the GUI to clear the screen before stopping the application.
 """
-import threading
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from devdeck.deck_manager import DeckManager
 
-# Thread-safe registry for the active DeckManager
+# The active DeckManager. Rebinding or reading a module global is a single
+# atomic operation, so no lock is needed around it.
 _active_deck_manager: Optional['DeckManager'] = None
-_registry_lock = threading.Lock()
 
 
 def register_deck_manager(deck_manager: 'DeckManager') -> None:
     """Register the active DeckManager instance."""
     global _active_deck_manager
-    with _registry_lock:
-        _active_deck_manager = deck_manager
+    _active_deck_manager = deck_manager
 
 
 def unregister_deck_manager() -> None:
     """Unregister the active DeckManager instance."""
     global _active_deck_manager
-    with _registry_lock:
-        _active_deck_manager = None
+    _active_deck_manager = None
 
 
 def get_deck_manager() -> Optional['DeckManager']:
     """Get the active DeckManager instance, if available."""
-    with _registry_lock:
-        return _active_deck_manager
-
+    return _active_deck_manager
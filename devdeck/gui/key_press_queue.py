@@ -1,21 +1,25 @@
 """
 Shared queue for Stream Deck key press events between DeckManager and GUI.
 
-This module provides a thread-safe queue that allows the DeckManager to send
-key press events to the GUI for display.
+This module provides a thread-safe bounded buffer that allows the DeckManager
+to send key press events to the GUI for display. When the GUI falls behind,
+the oldest events are dropped.
 """
 
-import queue
 import threading
+from collections import deque
+from typing import List, NamedTuple, Optional
 
-# Global queue for Stream Deck key press events
-_key_press_queue: queue.Queue = queue.Queue()
-_queue_lock = threading.Lock()
 
+class KeyPress(NamedTuple):
+    """A Stream Deck key press reported to the GUI"""
+    key_no: int
+    key_name: Optional[str] = None
+    midi_hex: Optional[str] = None
 
-def get_queue() -> queue.Queue:
-    """Get the global key press queue"""
-    return _key_press_queue
+# Global ring buffer for Stream Deck key press events
+_key_press_queue: deque = deque(maxlen=1024)
+_queue_lock = threading.Lock()
 
 
 def put_key_press(key_no: int, key_name: str = None, midi_hex: str = None):
@@ -27,9 +31,13 @@ def put_key_press(key_no: int, key_name: str = None, midi_hex: str = None):
         key_name: Optional key name (e.g., "Fill", "Break")
         midi_hex: Optional MIDI message as hex string (e.g., "F0 26 79 03 15 7F F7")
     """
-    try:
-        _key_press_queue.put_nowait((key_no, key_name, midi_hex))
-    except queue.Full:
-        # Queue is full, skip this event
-        pass
+    with _queue_lock:
+        _key_press_queue.append(KeyPress(key_no, key_name, midi_hex))
+
 
+def drain() -> List[KeyPress]:
+    """Remove and return all pending key press events, oldest first"""
+    with _queue_lock:
+        events = list(_key_press_queue)
+        _key_press_queue.clear()
+    return events
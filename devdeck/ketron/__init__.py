@@ -7,8 +7,8 @@ This package contains Ketron device-specific implementations including:
 - Ketron-specific controls
 """
 
-from devdeck.ketron.ketron import KetronMidi, COLOR_MAP
+from devdeck.ketron.ketron import KetronMidi, COLOR_MAP, resolve_color
 from devdeck.ketron.ketron_volume_manager import KetronVolumeManager
 
-__all__ = ['KetronMidi', 'KetronVolumeManager', 'COLOR_MAP']
+__all__ = ['KetronMidi', 'KetronVolumeManager', 'COLOR_MAP', 'resolve_color']
 
@@ -8,13 +8,18 @@ MIDI messages (pedal, tab, or CC) when a Stream Deck key is pressed.
 import json
 import logging
 import os
+import queue
+import stat
+import sys
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 from devdeck_core.controls.deck_control import DeckControl
 from devdeck.controls.base_control import BaseDeckControl
-from devdeck.ketron import KetronMidi, COLOR_MAP, KetronVolumeManager
+from devdeck.ketron import KetronMidi, KetronVolumeManager, resolve_color
 from devdeck.midi import MidiManager
 
 # Try to import key press queue for GUI integration
@@ -26,6 +31,113 @@ except ImportError:
     put_key_press = None
 from devdeck.controls.text_control import wrap_text_to_lines
 
+# orjson, if installed, parses key_mappings.json several times faster than the json module
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_LOG = logging.getLogger('devdeck')
+
+class KeyMappingEntry(NamedTuple):
+    """One key_mappings.json entry, with the fields _render needs derived once at load"""
+    key_no: int
+    key_name: str  # stripped; empty for deliberately blank keys
+    source_list_name: str
+    text_color: str
+    background_color: str
+    wrapped_text: str  # key_name wrapped to 6 characters per line
+    background: str  # background_color with custom color names mapped to hex
+    handler: object  # KetronKeyMappingControl method run on press; None for an invalid source
+
+
+# 'port' setting (None for auto-detect) -> MidiManager.close_count when a control opened it.
+# Later controls with the same setting skip the port checks (and auto-detection) in
+# initialize(); any close_port since then invalidates the entry
+_OPENED_PORTS = {}
+
+# KetronKeyMappingControl._rendered_mapping value when the key doesn't show its normal image
+_NOT_RENDERED = object()
+
+# Key press/release handlers waiting to run. They run oldest first on one worker thread, so
+# MIDI sends don't hold up the Stream Deck's key callback thread, while a volume key's
+# press still selects the volume before a following Volume Up, and a release never
+# overtakes the press that started a volume key repeat.
+# Queue feeding the running worker, or None when there is no worker. Each worker has its
+# own queue, so one that has been told to stop can't take events meant for its successor
+_key_events = None
+_key_events_lock = threading.Lock()
+
+
+def _run_key_events(events):
+    """Key event worker thread: run queued handlers one at a time until a None arrives"""
+    while True:
+        handler = events.get()
+        if handler is None:
+            return
+        try:
+            handler()
+        except Exception as e:
+            _LOG.error("Key event handler %s raised an unhandled exception: %s", handler, e, exc_info=True)
+
+
+def _queue_key_event(handler):
+    """Queue a key press/release handler, starting a worker thread if none is running"""
+    global _key_events
+    with _key_events_lock:
+        if _key_events is None:
+            _key_events = queue.SimpleQueue()
+            threading.Thread(target=_run_key_events, args=(_key_events,),
+                             name='ketron-key-events', daemon=True).start()
+        _key_events.put(handler)
+
+
+def _stop_key_events():
+    """
+    Let the worker run the events already queued and then exit, so that shutdown
+    (which joins every live thread) isn't left waiting on it. The next key event
+    starts a new worker.
+    """
+    global _key_events
+    with _key_events_lock:
+        if _key_events is not None:
+            _key_events.put(None)
+            _key_events = None
+
+
+# MIDI channel (0-indexed) that volume CC messages go out on: channel 16
+_VOLUME_CC_CHANNEL = 15
+
+
+@lru_cache(maxsize=2048)
+def _format_cc_hex(cc_channel, cc_control, value):
+    """Format a CC message as "Bn CC VV" for the GUI; held volume keys resend the same few values"""
+    return f'{0xB0 + cc_channel:02X} {cc_control:02X} {value:02X}'
+
+
+def _intern(value):
+    """sys.intern() a string read from key_mappings.json; anything else is returned unchanged"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# id(dictionary) -> (dictionary, {lowercased key: key}) for case-insensitive lookups.
+# The Ketron lookup tables are shared module constants, so each index is built once
+_LOWERCASE_INDEXES = {}
+
+
+def _lowercase_index(dictionary):
+    """Get the lowercased-key index for a dictionary, building it on first use"""
+    entry = _LOWERCASE_INDEXES.get(id(dictionary))
+    if entry is None or entry[0] is not dictionary:
+        index = {}
+        for dict_key in dictionary:
+            # Keep the first key when several differ only by case, as the old scan did
+            index.setdefault(dict_key.lower(), dict_key)
+        entry = (dictionary, index)
+        _LOWERCASE_INDEXES[id(dictionary)] = entry
+    return entry[1]
+
 
 class KetronKeyMappingControl(BaseDeckControl):
     """
@@ -47,27 +159,47 @@ class KetronKeyMappingControl(BaseDeckControl):
         midi_channel: MIDI channel for volume CC messages (optional, 1-16, default: 16)
     """
     
-    _key_mappings_cache = None
-    _key_mappings_file = None
-    _key_mappings_mtime = None  # File modification time for cache invalidation
+    # Seconds a loaded key_mappings.json is trusted before its mtime is checked again,
+    # so key presses don't each cost a stat; edits are picked up within this delay
+    KEY_MAPPINGS_CHECK_TTL = 2.0
+    
+    # Loaded key mappings, keyed by the resolved file path (str) so that every control and
+    # subclass naming the same file, however spelled, shares one parse. The dicts are only
+    # ever mutated in place, never rebound, so subclasses don't end up with their own copies
+    _key_mappings_cache = {}  # path -> {key_no: KeyMappingEntry}
+    _key_mappings_mtime_ns = {}  # path -> file modification time (integer ns) for cache invalidation
+    _key_mappings_checked_at = {}  # path -> time.monotonic() of the last load or mtime check
+    _key_mappings_paths = {}  # key_mappings_file argument -> path it resolved to
+    _DEFAULT_MAPPINGS_PATH = None  # Default key_mappings.json location, found on first use
     
     def __init__(self, key_no, **kwargs):
-        self.__logger = logging.getLogger('devdeck')
+        self.__logger = _LOG
         self.key_no = key_no  # Store key_no explicitly
         self.ketron_midi = KetronMidi()
         self.midi_manager = MidiManager()
         self.volume_manager = KetronVolumeManager()
         self.key_mapping = None
-        
-        # Volume key repeat state tracking
-        self._volume_key_pressed_time = None
+        # Mapping entry whose normal image is on the key, so released() can skip a redundant redraw
+        self._rendered_mapping = _NOT_RENDERED
+        # (mapping entry, what its handler looked up for it) from the last press, see _resolved_for
+        self._resolved = None
+        # Timer that restores the key image after a flash, and the number of the latest
+        # flash so that a restore which fired before a newer flash could cancel it does nothing
+        self._restore_timer = None
+        self._flash_generation = 0
+        
+        # Volume key repeat thread and the event that stops it. Each repeat gets a new
+        # event, which is the only state it shares with the key handlers
         self._volume_key_repeat_thread = None
         self._volume_key_repeat_stop = threading.Event()
-        self._volume_key_held = False
-        self._volume_key_type = None  # "UP" or "DOWN"
-        self._volume_key_repeat_lock = threading.Lock()
         
         super().__init__(key_no, **kwargs)
+        
+        # Settings don't change after construction; read the ones used on every press once
+        self._key_mappings_setting = self.settings.get('key_mappings_file')
+        self._port_name = self.settings.get('port')
+        self._cc_value = self.settings.get('cc_value', 64)  # Default to middle value
+        self._cc_channel = self.settings.get('cc_channel', 0)
     
     @classmethod
     def _load_key_mappings(cls, key_mappings_file=None):
@@ -78,40 +210,18 @@ class KetronKeyMappingControl(BaseDeckControl):
             key_mappings_file: Path to key_mappings.json file
         
         Returns:
-            Dictionary mapping key_no to mapping data, or None if file not found
+            Dictionary mapping key_no to KeyMappingEntry, or None if file not found
         """
         # Use cached data if file hasn't changed
-        if cls._key_mappings_cache is not None and cls._key_mappings_file == key_mappings_file:
-            # Check if file was modified by comparing modification times
-            if key_mappings_file is not None:
-                key_mappings_path = Path(key_mappings_file) if isinstance(key_mappings_file, str) else key_mappings_file
-                if key_mappings_path.exists():
-                    current_mtime = key_mappings_path.stat().st_mtime
-                    if cls._key_mappings_mtime is not None and current_mtime == cls._key_mappings_mtime:
-                        return cls._key_mappings_cache
-                    # File was modified, clear cache
-                    cls._key_mappings_cache = None
-                    cls._key_mappings_mtime = None
-                else:
-                    # File no longer exists, clear cache
-                    cls._key_mappings_cache = None
-                    cls._key_mappings_file = None
-                    cls._key_mappings_mtime = None
-                    return None
-            else:
-                # No file specified, return cached data if available
-                return cls._key_mappings_cache
+        path = cls._key_mappings_paths.get(key_mappings_file)
+        if path is not None:
+            cached = cls._cached_key_mappings(path)
+            if cached is not None:
+                return cached
         
+        source = key_mappings_file
         if key_mappings_file is None:
-            # Try to find key_mappings.json in config directory (preferred location)
-            # Path is now: devdeck/ketron/controls/ketron_key_mapping_control.py
-            # Need to go up 4 levels to get to project root
-            project_root = Path(__file__).parent.parent.parent.parent
-            key_mappings_file = project_root / 'config' / 'key_mappings.json'
-            
-            # Fallback to project root
-            if not key_mappings_file.exists():
-                key_mappings_file = project_root / 'key_mappings.json'
+            key_mappings_file = cls._default_key_mappings_path()
         
         # Convert to Path if it's a string
         if isinstance(key_mappings_file, str):
@@ -123,33 +233,43 @@ class KetronKeyMappingControl(BaseDeckControl):
                 # Resolve path to prevent directory traversal
                 key_mappings_file = key_mappings_file.resolve()
                 # Check if path exists
-                if not key_mappings_file.exists():
+                try:
+                    st = os.stat(key_mappings_file)
+                except FileNotFoundError:
                     return None
                 # Additional validation: ensure it's a file (not a directory)
-                if not key_mappings_file.is_file():
-                    logger = logging.getLogger('devdeck')
-                    logger.error("Key mappings path is not a file: %s", key_mappings_file)
+                if not stat.S_ISREG(st.st_mode):
+                    _LOG.error("Key mappings path is not a file: %s", key_mappings_file)
                     return None
             except (OSError, ValueError) as e:
-                logger = logging.getLogger('devdeck')
-                logger.error("Invalid key mappings file path %s: %s", key_mappings_file, e)
+                _LOG.error("Invalid key mappings file path %s: %s", key_mappings_file, e)
                 return None
         else:
             return None
         
+        # Another spelling of the same file may already be loaded
+        path = str(key_mappings_file)
+        cached = cls._cached_key_mappings(path)
+        if cached is not None:
+            cls._key_mappings_paths[source] = path
+            return cached
+        
+        # Entries from the previous load, reused below when their key is unchanged
+        previous = cls._key_mappings_cache.pop(path, None) or {}
+        
         try:
-            # Try UTF-16 first (Windows default), then UTF-8
-            try:
-                with open(key_mappings_file, 'r', encoding='utf-16') as f:
-                    content = f.read().strip()
-            except (UnicodeDecodeError, UnicodeError):
-                with open(key_mappings_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
+            # Read the whole file in one go; UTF-16 (Windows default) is recognised by its BOM,
+            # anything else is parsed as UTF-8 bytes (orjson rejects a UTF-8 BOM, so drop it)
+            content = key_mappings_file.read_bytes()
+            if content[:2] in (b'\xff\xfe', b'\xfe\xff'):
+                content = content.decode('utf-16')
+            elif content[:3] == b'\xef\xbb\xbf':
+                content = content[3:]
             
-            if not content:
+            if not content.strip():
                 return None
             
-            key_mappings_data = json.loads(content)
+            key_mappings_data = _json_loads(content)
             
             # Handle both named structure {"key_mappings": [...]} and direct array [...]
             if isinstance(key_mappings_data, dict) and 'key_mappings' in key_mappings_data:
@@ -159,31 +279,113 @@ class KetronKeyMappingControl(BaseDeckControl):
             else:
                 return None
             
-            # Create a dictionary for quick lookup: key_no -> mapping
-            mappings_dict = {mapping['key_no']: mapping for mapping in key_mappings}
+            # Create a dictionary for quick lookup: key_no -> KeyMappingEntry
+            mappings_dict = {}
+            for mapping in key_mappings:
+                key_no = mapping.get('key_no')
+                if key_no is None:
+                    _LOG.warning("Skipping key mapping without key_no: %s", mapping)
+                    continue
+                raw_key_name = mapping.get('key_name', '')
+                if not isinstance(raw_key_name, str):
+                    _LOG.warning("Skipping key mapping with non-string key_name: %s", mapping)
+                    continue
+                # Strings are interned, so all entries share one copy of each of the handful
+                # of distinct source and color names, and equal names compare by identity
+                fields = (
+                    key_no,
+                    _intern(raw_key_name.strip()),
+                    _intern(mapping.get('source_list_name', '')),
+                    _intern(mapping.get('text_color', 'white')),
+                    _intern(mapping.get('background_color', 'black')),
+                )
+                # Keep the previous entry (and its derived fields) if the key is unchanged
+                old = previous.get(key_no)
+                if old is not None and old[:5] == fields:
+                    mappings_dict[key_no] = old
+                    continue
+                
+                # Derive what _render needs once per load rather than on every render:
+                # text wrapped to maximum 6 characters per line (with \n escape sequences
+                # converted to actual newlines) and the background with custom color names
+                # mapped to hex values
+                wrapped_text = wrap_text_to_lines(raw_key_name, max_chars_per_line=6).replace('\\n', '\n')
+                # Pick the press handler: Volume Up, Volume Down and Mute work regardless
+                # of source_list_name, all other keys are handled by their source list
+                handler = cls._SPECIAL_HANDLERS.get(fields[1].upper()) or cls._SOURCE_HANDLERS.get(fields[2])
+                mappings_dict[key_no] = KeyMappingEntry(*fields, wrapped_text, resolve_color(fields[4]), handler)
             
-            # Cache the result along with file modification time
-            cls._key_mappings_cache = mappings_dict
-            cls._key_mappings_file = key_mappings_file
-            cls._key_mappings_mtime = key_mappings_file.stat().st_mtime
+            # Cache the result along with file modification time (from the stat above,
+            # so an edit made while the file was being read triggers another reload).
+            # The cache entry goes in last: _cached_key_mappings looks up the times of
+            # any path it finds in the cache, possibly from another thread
+            cls._key_mappings_mtime_ns[path] = st.st_mtime_ns
+            cls._key_mappings_checked_at[path] = time.monotonic()
+            cls._key_mappings_cache[path] = mappings_dict
+            cls._key_mappings_paths[source] = path
             
             return mappings_dict
             
         except Exception as e:
-            logger = logging.getLogger('devdeck')
-            logger.error(f"Error loading key mappings from {key_mappings_file}: {e}")
+            _LOG.error("Error loading key mappings from %s: %s", key_mappings_file, e)
+            return None
+    
+    @classmethod
+    def _cached_key_mappings(cls, path):
+        """
+        Get the cached mappings for a resolved path, or None if absent or out of date.
+        
+        Within KEY_MAPPINGS_CHECK_TTL of the last check the cache is trusted as is;
+        after that a single stat covers the exists, is-a-file and modification time checks.
+        """
+        cached = cls._key_mappings_cache.get(path)
+        if cached is None:
             return None
+        now = time.monotonic()
+        if now - cls._key_mappings_checked_at[path] < cls.KEY_MAPPINGS_CHECK_TTL:
+            return cached
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is not None and stat.S_ISREG(st.st_mode) and st.st_mtime_ns == cls._key_mappings_mtime_ns[path]:
+            cls._key_mappings_checked_at[path] = now
+            return cached
+        # File was modified or removed; the caller reloads it
+        return None
     
-    def _get_key_mapping(self):
-        """Get the mapping for this control's key_no"""
-        key_mappings_file = self.settings.get('key_mappings_file')
-        mappings = self._load_key_mappings(key_mappings_file)
+    @classmethod
+    def _default_key_mappings_path(cls):
+        """Locate the default key_mappings.json, remembering it once a file has been found"""
+        if cls._DEFAULT_MAPPINGS_PATH is not None:
+            return cls._DEFAULT_MAPPINGS_PATH
+        
+        # Try to find key_mappings.json in config directory (preferred location)
+        # Path is now: devdeck/ketron/controls/ketron_key_mapping_control.py
+        # Need to go up 4 levels to get to project root
+        project_root = Path(__file__).resolve().parents[3]
+        key_mappings_file = project_root / 'config' / 'key_mappings.json'
+        
+        # Fallback to project root
+        if not key_mappings_file.exists():
+            key_mappings_file = project_root / 'key_mappings.json'
+            if not key_mappings_file.exists():
+                # Neither exists yet; look again next time rather than caching a miss
+                return key_mappings_file
+        
+        cls._DEFAULT_MAPPINGS_PATH = key_mappings_file
+        return key_mappings_file
+    
+    def _get_key_mapping(self, lookup_key=None):
+        """Get the mapping for this control's key_no (or lookup_key, if the caller already worked it out)"""
+        mappings = self._load_key_mappings(self._key_mappings_setting)
         
         if mappings is None:
             return None
         
         # Use offset_key_no if available (for SecondPageDeckController which maps keys 0-14 to mappings 15-29)
-        lookup_key = getattr(self, 'offset_key_no', self.key_no)
+        if lookup_key is None:
+            lookup_key = getattr(self, 'offset_key_no', self.key_no)
         
         return mappings.get(lookup_key)
     
@@ -202,28 +404,34 @@ class KetronKeyMappingControl(BaseDeckControl):
             if 1 <= midi_channel <= 16:
                 self.volume_manager.set_midi_out_channel(midi_channel)
             else:
-                self.__logger.warning(f"Invalid MIDI channel {midi_channel}, must be 1-16. Using default channel 16.")
+                self.__logger.warning("Invalid MIDI channel %s, must be 1-16. Using default channel 16.", midi_channel)
         
         # Open MIDI port - auto-detect if not specified or not found
-        port_name = self.settings.get('port')
+        port_name = self._port_name
+        close_count = self.midi_manager.close_count
+        if _OPENED_PORTS.get(port_name) == close_count:
+            # Another control on this deck already opened this port
+            self._render()
+            return
+        port_setting = port_name
         
         # If port is specified, try to use it (backward compatibility)
         if port_name:
             # Check if the specified port is already open
             if self.midi_manager.is_port_open(port_name):
-                self.__logger.info(f"MIDI port already open: {port_name}")
+                self.__logger.info("MIDI port already open: %s", port_name)
             else:
                 # Try to open the specified port (with partial matching)
-                self.__logger.info(f"Attempting to open specified MIDI port: {port_name}")
+                self.__logger.info("Attempting to open specified MIDI port: %s", port_name)
                 if self.midi_manager.open_port(port_name):
-                    self.__logger.info(f"Successfully opened specified MIDI port: {port_name}")
+                    self.__logger.info("Successfully opened specified MIDI port: %s", port_name)
                 else:
                     # Port not found, try auto-detection
-                    self.__logger.warning(f"Specified MIDI port '{port_name}' not found, attempting auto-detection")
+                    self.__logger.warning("Specified MIDI port '%s' not found, attempting auto-detection", port_name)
                     detected_port = self.midi_manager.auto_detect_midi_port()
                     if detected_port:
                         port_name = detected_port
-                        self.__logger.info(f"Auto-detected MIDI port: {port_name}")
+                        self.__logger.info("Auto-detected MIDI port: %s", port_name)
                         if not self.midi_manager.open_port(port_name):
                             self.__logger.error("Failed to open auto-detected MIDI port")
                             self._render_error("MIDI\nPORT\nERROR")
@@ -241,7 +449,7 @@ class KetronKeyMappingControl(BaseDeckControl):
             detected_port = self.midi_manager.auto_detect_midi_port()
             if detected_port:
                 port_name = detected_port
-                self.__logger.info(f"Auto-detected MIDI port: {port_name}")
+                self.__logger.info("Auto-detected MIDI port: %s", port_name)
                 if not self.midi_manager.open_port(port_name):
                     self.__logger.error("Failed to open auto-detected MIDI port")
                     self._render_error("MIDI\nPORT\nERROR")
@@ -254,6 +462,8 @@ class KetronKeyMappingControl(BaseDeckControl):
                     self._render_error("MIDI\nPORT\nERROR")
                     return
         
+        _OPENED_PORTS[port_setting] = close_count
+        
         # Render the control
         self._render()
     
@@ -261,6 +471,7 @@ class KetronKeyMappingControl(BaseDeckControl):
         """Render the control with text and colors from key_mappings.json"""
         # Refresh key_mapping to ensure we have the latest data (cache invalidation handled in _load_key_mappings)
         self.key_mapping = self._get_key_mapping()
+        self._rendered_mapping = _NOT_RENDERED
         
         with self.deck_context() as context:
             with context.renderer() as r:
@@ -272,38 +483,31 @@ class KetronKeyMappingControl(BaseDeckControl):
                         .center_vertically()\
                         .center_horizontally()\
                         .end()
+                    self._rendered_mapping = None
                     return
                 
-                # Get text and colors from mapping
-                key_name = self.key_mapping.get('key_name', '')
-                text_color = self.key_mapping.get('text_color', 'white')
+                # Get text and colors from mapping (wrapped text and background prepared at load)
                 # Use override if provided, otherwise use from mapping
-                background_color = background_color_override if background_color_override else self.key_mapping.get('background_color', 'black')
-                
-                # Wrap text to maximum 6 characters per line
-                wrapped_text = wrap_text_to_lines(key_name, max_chars_per_line=6)
-                # Convert \n escape sequences to actual newlines for rendering
-                wrapped_text = wrapped_text.replace('\\n', '\n')
-                
-                # Map custom color names to hex values
-                standard_colors = {'blue', 'green', 'red', 'yellow', 'orange', 'purple', 'white', 'black', 'grey', 'gray', 'cyan', 'magenta', 'pink', 'brown', 'teal', 'navy', 'maroon', 'lime', 'silver', 'gold', 'lightblue', 'lightgreen', 'lightgray', 'darkblue', 'darkgreen', 'darkred'}
-                
-                if background_color.lower() not in standard_colors:
-                    # It's a custom color name, check COLOR_MAP
-                    if background_color in COLOR_MAP:
-                        hex_value = COLOR_MAP[background_color]
-                        background_color = f"#{hex_value:06X}"
-                    elif background_color.lower() in COLOR_MAP:
-                        hex_value = COLOR_MAP[background_color.lower()]
-                        background_color = f"#{hex_value:06X}"
+                if background_color_override:
+                    background_color = resolve_color(background_color_override)
+                else:
+                    background_color = self.key_mapping.background
                 
                 r.background_color(background_color)
-                r.text(wrapped_text)\
+                r.text(self.key_mapping.wrapped_text)\
                     .font_size(100)\
-                    .color(text_color)\
+                    .color(self.key_mapping.text_color)\
                     .center_vertically()\
                     .center_horizontally()\
                     .end()
+        
+        if not background_color_override:
+            self._rendered_mapping = self.key_mapping
+    
+    def _render_error(self, error_text: str, font_size: int = 70) -> None:
+        """Render an error message, noting that the key no longer shows its normal image"""
+        self._rendered_mapping = _NOT_RENDERED
+        super()._render_error(error_text, font_size)
     
     def _flash_key(self, flash_color: str, flash_duration_ms: int = 100) -> None:
         """
@@ -317,12 +521,7 @@ class KetronKeyMappingControl(BaseDeckControl):
         self._render(background_color_override=flash_color)
         
         # Restore original state after flash duration
-        def _restore_after_flash():
-            time.sleep(flash_duration_ms / 1000.0)
-            self._render()
-        
-        thread = threading.Thread(target=_restore_after_flash, daemon=True)
-        thread.start()
+        self._schedule_restore(flash_duration_ms)
     
     def _flash_key_with_error(self, flash_color: str, error_text: str, flash_duration_ms: int = 100) -> None:
         """
@@ -334,20 +533,11 @@ class KetronKeyMappingControl(BaseDeckControl):
             flash_duration_ms: Duration of flash in milliseconds (default: 100)
         """
         # Render error message with flash background
+        self._rendered_mapping = _NOT_RENDERED
         with self.deck_context() as context:
             with context.renderer() as r:
                 # Convert color if needed
-                standard_colors = {'blue', 'green', 'red', 'yellow', 'orange', 'purple', 'white', 'black', 'grey', 'gray', 'cyan', 'magenta', 'pink', 'brown', 'teal', 'navy', 'maroon', 'lime', 'silver', 'gold', 'lightblue', 'lightgreen', 'lightgray', 'darkblue', 'darkgreen', 'darkred'}
-                bg_color = flash_color
-                if bg_color.lower() not in standard_colors:
-                    if bg_color in COLOR_MAP:
-                        hex_value = COLOR_MAP[bg_color]
-                        bg_color = f"#{hex_value:06X}"
-                    elif bg_color.lower() in COLOR_MAP:
-                        hex_value = COLOR_MAP[bg_color.lower()]
-                        bg_color = f"#{hex_value:06X}"
-                
-                r.background_color(bg_color)
+                r.background_color(resolve_color(flash_color))
                 r.text(error_text)\
                     .font_size(70)\
                     .color('red')\
@@ -356,12 +546,26 @@ class KetronKeyMappingControl(BaseDeckControl):
                     .end()
         
         # Restore original state after flash duration
-        def _restore_after_flash():
-            time.sleep(flash_duration_ms / 1000.0)
+        self._schedule_restore(flash_duration_ms)
+    
+    def _schedule_restore(self, delay_ms):
+        """Redraw the key's normal image after delay_ms, replacing any restore still pending"""
+        if self._restore_timer is not None:
+            self._restore_timer.cancel()
+        self._flash_generation += 1
+        self._restore_timer = threading.Timer(delay_ms / 1000.0, self._restore_after_flash,
+                                              args=(self._flash_generation,))
+        self._restore_timer.daemon = True
+        self._restore_timer.start()
+    
+    def _restore_after_flash(self, generation):
+        """Timer callback: redraw the key's normal image unless another flash has started since"""
+        if generation == self._flash_generation:
             self._render()
-        
-        thread = threading.Thread(target=_restore_after_flash, daemon=True)
-        thread.start()
+    
+    def _restore_pending(self):
+        """Whether a flash restore is still to run (and will redraw the key)"""
+        return self._restore_timer is not None and self._restore_timer.is_alive()
     
     def _find_key_in_dict(self, key_name, dictionary):
         """
@@ -379,19 +583,18 @@ class KetronKeyMappingControl(BaseDeckControl):
             return key_name
         
         # Try case-insensitive match
-        key_name_lower = key_name.lower()
-        for dict_key in dictionary.keys():
-            if dict_key.lower() == key_name_lower:
-                return dict_key
-        
-        return None
+        return _lowercase_index(dictionary).get(key_name.lower())
     
-    def _start_volume_key_repeat(self):
+    def _start_volume_key_repeat(self, key_type, stop):
         """
         Background thread that handles volume key repeat functionality.
         
         Waits for initial delay, then repeatedly calls increment/decrement
         at the configured interval until the key is released.
+        
+        Args:
+            key_type: "UP" or "DOWN"
+            stop: Event set when the key is released (or another repeat starts)
         """
         # Get configuration values with defaults
         repeat_delay_ms = self.settings.get('volume_key_repeat_delay_ms', 500)
@@ -401,49 +604,41 @@ class KetronKeyMappingControl(BaseDeckControl):
         repeat_delay = repeat_delay_ms / 1000.0
         repeat_interval = repeat_interval_ms / 1000.0
         
-        port_name = self.settings.get('port')
+        port_name = self._port_name
         
         # Wait for initial delay
-        if self._volume_key_repeat_stop.wait(timeout=repeat_delay):
+        if stop.wait(timeout=repeat_delay):
             # Stop event was set during initial delay, exit
             return
         
-        # Check if key is still held after initial delay
-        with self._volume_key_repeat_lock:
-            if not self._volume_key_held:
-                return
-            key_type = self._volume_key_type
-        
-        # Start repeating increment/decrement actions
-        while not self._volume_key_repeat_stop.is_set():
-            # Check if key is still held
-            with self._volume_key_repeat_lock:
-                if not self._volume_key_held:
-                    break
-                current_key_type = self._volume_key_type
-            
-            # Only proceed if key type matches (handles case where key is released and different key pressed)
-            if current_key_type != key_type:
-                break
+        # Start repeating increment/decrement actions on a fixed monotonic schedule, so a slow
+        # send doesn't push every later step back. Steps that fell due while the previous one
+        # was still sending are applied together, as one CC, rather than as a burst
+        next_deadline = time.monotonic()
+        while True:
+            steps = 1
+            if repeat_interval > 0:
+                steps += max(0, int((time.monotonic() - next_deadline) / repeat_interval))
+            next_deadline += steps * repeat_interval
             
             # Perform increment or decrement based on key type
             try:
                 if key_type == "UP":
-                    new_volume = self.volume_manager.increment_last_pressed_volume(port_name=port_name)
+                    new_volume = self.volume_manager.increment_last_pressed_volume(steps, port_name=port_name)
                     if new_volume is None:
                         self.__logger.warning("Volume Up repeat: no last pressed volume key set")
                         break
-                elif key_type == "DOWN":
-                    new_volume = self.volume_manager.decrement_last_pressed_volume(port_name=port_name)
+                else:
+                    new_volume = self.volume_manager.decrement_last_pressed_volume(steps, port_name=port_name)
                     if new_volume is None:
                         self.__logger.warning("Volume Down repeat: no last pressed volume key set")
                         break
             except Exception as e:
-                self.__logger.error(f"Error during volume key repeat: {e}", exc_info=True)
+                self.__logger.error("Error during volume key repeat: %s", e, exc_info=True)
                 break
             
-            # Wait for repeat interval (or until stop event is set)
-            if self._volume_key_repeat_stop.wait(timeout=repeat_interval):
+            # Wait until the next step is due (or until stop event is set)
+            if stop.wait(timeout=max(0.0, next_deadline - time.monotonic())):
                 # Stop event was set, exit
                 break
     
@@ -451,10 +646,6 @@ class KetronKeyMappingControl(BaseDeckControl):
         """
         Stop the volume key repeat thread and clean up resources.
         """
-        with self._volume_key_repeat_lock:
-            self._volume_key_held = False
-            self._volume_key_type = None
-        
         # Signal thread to stop
         self._volume_key_repeat_stop.set()
         
@@ -468,300 +659,306 @@ class KetronKeyMappingControl(BaseDeckControl):
         self._volume_key_repeat_thread = None
     
     def pressed(self):
-        """Send MIDI message when key is pressed"""
+        """Send MIDI message when key is pressed (on the key event worker thread)"""
+        _queue_key_event(self._handle_press)
+    
+    def _handle_press(self):
+        """Look up this key's mapping and run its handler"""
         # Re-fetch the mapping in case offset_key_no was set after initialize()
         # This ensures SecondPageDeckController uses the correct offset
-        lookup_key = getattr(self, 'offset_key_no', self.key_no)
-        self.__logger.info(f"KetronKeyMappingControl.pressed() called for key {self.key_no} (lookup_key: {lookup_key}, offset_key_no: {getattr(self, 'offset_key_no', 'not set')})")
+        offset = getattr(self, 'offset_key_no', None)
+        lookup_key = self.key_no if offset is None else offset
+        self.__logger.debug("KetronKeyMappingControl.pressed() called for key %s (lookup_key: %s, offset_key_no: %s)", self.key_no, lookup_key, 'not set' if offset is None else offset)
         
-        self.key_mapping = self._get_key_mapping()
+        self.key_mapping = self._get_key_mapping(lookup_key)
         
         if self.key_mapping is None:
             # Log with offset info for debugging
-            self.__logger.warning(f"No mapping found for key {self.key_no} (lookup_key: {lookup_key}, offset_key_no: {getattr(self, 'offset_key_no', 'not set')})")
+            self.__logger.warning("No mapping found for key %s (lookup_key: %s, offset_key_no: %s)", self.key_no, lookup_key, 'not set' if offset is None else offset)
             return
         
         # Log which mapping is being used (for debugging)
-        self.__logger.info(f"Key {self.key_no} pressed, using mapping from key_mappings[{lookup_key}]: {self.key_mapping.get('key_name', 'N/A')}")
+        self.__logger.debug("Key %s pressed, using mapping from key_mappings[%s]: %s", self.key_no, lookup_key, self.key_mapping.key_name)
         
-        key_name = self.key_mapping.get('key_name', '').strip()
-        source_list_name = self.key_mapping.get('source_list_name', '')
-        port_name = self.settings.get('port')
+        key_name = self.key_mapping.key_name
+        source_list_name = self.key_mapping.source_list_name
+        port_name = self._port_name
         
         # Skip if key_name is empty or just whitespace
         if not key_name:
-            self.__logger.debug(f"Key {self.key_no} has empty key_name, skipping MIDI send")
+            self.__logger.debug("Key %s has empty key_name, skipping MIDI send", self.key_no)
             return
         
-        # Special handling for Volume Up, Volume Down, and Mute buttons
-        # These work regardless of source_list_name
-        if key_name.upper() == "VOLUME UP":
-            # Stop any existing repeat thread (in case of rapid key presses)
-            self._stop_volume_key_repeat()
-            
-            # Record press timestamp and set state
-            with self._volume_key_repeat_lock:
-                self._volume_key_pressed_time = time.time()
-                self._volume_key_held = True
-                self._volume_key_type = "UP"
-                self._volume_key_repeat_stop.clear()
-            
-            # Start repeat thread
-            self._volume_key_repeat_thread = threading.Thread(
-                target=self._start_volume_key_repeat,
-                daemon=True
-            )
-            self._volume_key_repeat_thread.start()
-            
-            # Execute initial increment immediately
-            new_volume = self.volume_manager.increment_last_pressed_volume(port_name=port_name)
-            if new_volume is None:
-                self.__logger.warning("Volume Up pressed but no last pressed volume key set")
-                self._render_error("NO\nVOLUME\nSELECTED")
-                # Stop repeat thread if initial action failed
-                self._stop_volume_key_repeat()
-            else:
-                self.__logger.info(f"Volume Up: incremented to {new_volume}")
-                # Notify GUI of key press with MIDI hex
-                if _GUI_AVAILABLE and put_key_press:
-                    try:
-                        # Get the last pressed volume key to determine CC control
-                        last_key = self.volume_manager.last_pressed_key_name
-                        if last_key:
-                            # Case-insensitive lookup in cc_midis
-                            cc_control = None
-                            for cc_key in self.ketron_midi.cc_midis.keys():
-                                if cc_key.upper() == last_key.upper():
-                                    cc_control = self.ketron_midi.cc_midis[cc_key]
-                                    break
-                            if cc_control is not None:
-                                # Format CC message: Bn CC VV where n is channel (15 = channel 16)
-                                cc_channel = 15  # Channel 16 (0-indexed: 15)
-                                cc_status = 0xB0 + cc_channel
-                                midi_hex = f'{cc_status:02X} {cc_control:02X} {new_volume:02X}'
-                                put_key_press(self.key_no, key_name, midi_hex)
-                    except Exception:
-                        pass  # GUI not available, continue normally
+        # Handler was chosen from key_name and source_list_name when the mapping was loaded
+        handler = self.key_mapping.handler
+        if handler is None:
+            self.__logger.error("Invalid source_list_name '%s' for key %s", source_list_name, self.key_no)
+            self._render_error("INVALID\nSOURCE")
             return
         
-        elif key_name.upper() == "VOLUME DOWN":
-            # Stop any existing repeat thread (in case of rapid key presses)
+        try:
+            handler(self, key_name, port_name)
+        except Exception as e:
+            self.__logger.error("Error sending MIDI message for key %s: %s", self.key_no, e, exc_info=True)
+            self._render_error("ERROR")
+    
+    def _handle_volume_up(self, key_name, port_name):
+        """Volume Up: step the last selected volume up and start key repeat"""
+        # Stop any existing repeat thread (in case of rapid key presses)
+        self._stop_volume_key_repeat()
+        
+        # Start repeat thread. A fresh stop event means a previous thread that outlived
+        # the join above still sees its own event set and can't be revived by this press
+        self._volume_key_repeat_stop = threading.Event()
+        self._volume_key_repeat_thread = threading.Thread(
+            target=self._start_volume_key_repeat,
+            args=("UP", self._volume_key_repeat_stop),
+            daemon=True
+        )
+        self._volume_key_repeat_thread.start()
+        
+        # Execute initial increment immediately
+        new_volume = self.volume_manager.increment_last_pressed_volume(port_name=port_name)
+        if new_volume is None:
+            self.__logger.warning("Volume Up pressed but no last pressed volume key set")
+            self._render_error("NO\nVOLUME\nSELECTED")
+            # Stop repeat thread if initial action failed
             self._stop_volume_key_repeat()
-            
-            # Record press timestamp and set state
-            with self._volume_key_repeat_lock:
-                self._volume_key_pressed_time = time.time()
-                self._volume_key_held = True
-                self._volume_key_type = "DOWN"
-                self._volume_key_repeat_stop.clear()
-            
-            # Start repeat thread
-            self._volume_key_repeat_thread = threading.Thread(
-                target=self._start_volume_key_repeat,
-                daemon=True
-            )
-            self._volume_key_repeat_thread.start()
-            
-            # Execute initial decrement immediately
-            new_volume = self.volume_manager.decrement_last_pressed_volume(port_name=port_name)
-            if new_volume is None:
-                self.__logger.warning("Volume Down pressed but no last pressed volume key set")
-                self._render_error("NO\nVOLUME\nSELECTED")
-                # Stop repeat thread if initial action failed
-                self._stop_volume_key_repeat()
-            else:
-                self.__logger.info(f"Volume Down: decremented to {new_volume}")
-                # Notify GUI of key press with MIDI hex
-                if _GUI_AVAILABLE and put_key_press:
-                    try:
-                        # Get the last pressed volume key to determine CC control
-                        last_key = self.volume_manager.last_pressed_key_name
-                        if last_key:
-                            # Case-insensitive lookup in cc_midis
-                            cc_control = None
-                            for cc_key in self.ketron_midi.cc_midis.keys():
-                                if cc_key.upper() == last_key.upper():
-                                    cc_control = self.ketron_midi.cc_midis[cc_key]
-                                    break
-                            if cc_control is not None:
-                                # Format CC message: Bn CC VV where n is channel (15 = channel 16)
-                                cc_channel = 15  # Channel 16 (0-indexed: 15)
-                                cc_status = 0xB0 + cc_channel
-                                midi_hex = f'{cc_status:02X} {cc_control:02X} {new_volume:02X}'
-                                put_key_press(self.key_no, key_name, midi_hex)
-                    except Exception:
-                        pass  # GUI not available, continue normally
-            return
+        else:
+            self.__logger.info("Volume Up: incremented to %s", new_volume)
+            self._notify_gui_volume(key_name, new_volume)
+    
+    def _handle_volume_down(self, key_name, port_name):
+        """Volume Down: step the last selected volume down and start key repeat"""
+        # Stop any existing repeat thread (in case of rapid key presses)
+        self._stop_volume_key_repeat()
         
-        elif key_name.upper() == "MUTE":
-            # Toggle mute for the last pressed volume
-            new_volume = self.volume_manager.toggle_mute_last_pressed_volume(port_name=port_name)
-            if new_volume is None:
-                self.__logger.warning("Mute pressed but no last pressed volume key set")
-                self._render_error("NO\nVOLUME\nSELECTED")
+        # Start repeat thread. A fresh stop event means a previous thread that outlived
+        # the join above still sees its own event set and can't be revived by this press
+        self._volume_key_repeat_stop = threading.Event()
+        self._volume_key_repeat_thread = threading.Thread(
+            target=self._start_volume_key_repeat,
+            args=("DOWN", self._volume_key_repeat_stop),
+            daemon=True
+        )
+        self._volume_key_repeat_thread.start()
+        
+        # Execute initial decrement immediately
+        new_volume = self.volume_manager.decrement_last_pressed_volume(port_name=port_name)
+        if new_volume is None:
+            self.__logger.warning("Volume Down pressed but no last pressed volume key set")
+            self._render_error("NO\nVOLUME\nSELECTED")
+            # Stop repeat thread if initial action failed
+            self._stop_volume_key_repeat()
+        else:
+            self.__logger.info("Volume Down: decremented to %s", new_volume)
+            self._notify_gui_volume(key_name, new_volume)
+    
+    def _handle_mute(self, key_name, port_name):
+        """Mute: toggle mute for the last selected volume"""
+        # Toggle mute for the last pressed volume
+        new_volume = self.volume_manager.toggle_mute_last_pressed_volume(port_name=port_name)
+        if new_volume is None:
+            self.__logger.warning("Mute pressed but no last pressed volume key set")
+            self._render_error("NO\nVOLUME\nSELECTED")
+        else:
+            if new_volume == 0:
+                self.__logger.info("Mute: muted volume (set to %s)", new_volume)
             else:
-                if new_volume == 0:
-                    self.__logger.info(f"Mute: muted volume (set to {new_volume})")
-                else:
-                    self.__logger.info(f"Mute: unmuted volume (restored to {new_volume})")
-                # Notify GUI of key press with MIDI hex
-                if _GUI_AVAILABLE and put_key_press:
-                    try:
-                        # Get the last pressed volume key to determine CC control
-                        last_key = self.volume_manager.last_pressed_key_name
-                        if last_key:
-                            # Case-insensitive lookup in cc_midis
-                            cc_control = None
-                            for cc_key in self.ketron_midi.cc_midis.keys():
-                                if cc_key.upper() == last_key.upper():
-                                    cc_control = self.ketron_midi.cc_midis[cc_key]
-                                    break
-                            if cc_control is not None:
-                                # Format CC message: Bn CC VV where n is channel (15 = channel 16)
-                                cc_channel = 15  # Channel 16 (0-indexed: 15)
-                                cc_status = 0xB0 + cc_channel
-                                midi_hex = f'{cc_status:02X} {cc_control:02X} {new_volume:02X}'
-                                put_key_press(self.key_no, key_name, midi_hex)
-                    except Exception:
-                        pass  # GUI not available, continue normally
+                self.__logger.info("Mute: unmuted volume (restored to %s)", new_volume)
+            self._notify_gui_volume(key_name, new_volume)
+    
+    def _notify_gui_volume(self, key_name, new_volume):
+        """Notify GUI of a Volume Up/Down/Mute press with the CC sent for the last selected volume"""
+        if not (_GUI_AVAILABLE and put_key_press):
             return
-        
         try:
-            if source_list_name == 'pedal_midis':
-                # Find the matching key (case-insensitive)
-                matched_key = self._find_key_in_dict(key_name, self.ketron_midi.pedal_midis)
-                if matched_key is None:
-                    self.__logger.error(f"Key name '{key_name}' not found in pedal_midis for key {self.key_no}")
-                    self._render_error("INVALID\nKEY")
-                    return
-                
-                # Format SysEx message as hex for GUI display (ON message)
-                sysex_data = self.ketron_midi.format_pedal_sysex(matched_key, on_state=True)
-                midi_hex = ' '.join([f'F0'] + [f'{b:02X}' for b in sysex_data] + [f'F7'])
-                
-                # Send pedal command
-                success = self.ketron_midi.send_pedal_command(matched_key, port_name)
-                if not success:
-                    self.__logger.error(f"Failed to send pedal command '{matched_key}' for key {self.key_no}")
-                    # Flash with red background for failure (error message will be shown during flash)
-                    self._flash_key_with_error('red', "SEND\nFAILED")
-                else:
-                    self.__logger.info(f"Sent pedal command '{matched_key}' for key {self.key_no}")
-                    # Flash with white background for success
-                    self._flash_key('white')
-                    # Notify GUI of key press with MIDI hex
-                    if _GUI_AVAILABLE and put_key_press:
-                        try:
-                            put_key_press(self.key_no, key_name, midi_hex)
-                        except Exception:
-                            pass  # GUI not available, continue normally
+            # Get the last pressed volume key to determine CC control
+            last_key = self.volume_manager.last_pressed_key_name
+            if not last_key:
+                return
+            # Case-insensitive lookup in cc_midis
+            matched_key = self._find_key_in_dict(last_key, self.ketron_midi.cc_midis)
+            if matched_key is not None:
+                cc_control = self.ketron_midi.cc_midis[matched_key]
+                midi_hex = _format_cc_hex(_VOLUME_CC_CHANNEL, cc_control, new_volume)
+                put_key_press(self.key_no, key_name, midi_hex)
+        except Exception:
+            pass  # GUI not available, continue normally
+    
+    def _resolved_for(self, key_mapping):
+        """
+        Get what the handler looked up for this mapping entry on an earlier press, or None.
+        
+        The lookups only depend on the entry, and a changed entry in a reloaded
+        key_mappings.json is a new object, so it resolves again.
+        """
+        resolved = self._resolved
+        if resolved is not None and resolved[0] is key_mapping:
+            return resolved[1]
+        return None
+    
+    def _send_pedal(self, key_name, port_name):
+        """Send a pedal_midis SysEx command"""
+        ketron_midi = self.ketron_midi
+        self._send_sysex(key_name, port_name, 'pedal', ketron_midi.pedal_midis,
+                         ketron_midi.format_pedal_sysex, ketron_midi.send_pedal_command)
+    
+    def _send_tab(self, key_name, port_name):
+        """Send a tab_midis SysEx command"""
+        ketron_midi = self.ketron_midi
+        self._send_sysex(key_name, port_name, 'tab', ketron_midi.tab_midis,
+                         ketron_midi.format_tab_sysex, ketron_midi.send_tab_command)
+    
+    def _send_sysex(self, key_name, port_name, kind, midis, format_sysex, send_command):
+        """
+        Send a pedal or tab SysEx command, then flash the key and notify the GUI.
+        
+        Args:
+            key_name: Key name from the mapping
+            port_name: MIDI port name (None for the first open port)
+            kind: "pedal" or "tab", for log messages
+            midis: KetronMidi lookup table to find key_name in
+            format_sysex: KetronMidi method formatting the SysEx message for a table key
+            send_command: KetronMidi method sending the command for a table key
+        """
+        resolved = self._resolved_for(self.key_mapping)
+        if resolved is None:
+            # Find the matching key (case-insensitive)
+            matched_key = self._find_key_in_dict(key_name, midis)
+            if matched_key is None:
+                self.__logger.error("Key name '%s' not found in %s_midis for key %s", key_name, kind, self.key_no)
+                self._render_error("INVALID\nKEY")
+                return
             
-            elif source_list_name == 'tab_midis':
-                # Find the matching key (case-insensitive)
-                matched_key = self._find_key_in_dict(key_name, self.ketron_midi.tab_midis)
-                if matched_key is None:
-                    self.__logger.error(f"Key name '{key_name}' not found in tab_midis for key {self.key_no}")
-                    self._render_error("INVALID\nKEY")
-                    return
-                
-                # Format SysEx message as hex for GUI display (ON message)
-                sysex_data = self.ketron_midi.format_tab_sysex(matched_key, on_state=True)
-                midi_hex = ' '.join([f'F0'] + [f'{b:02X}' for b in sysex_data] + [f'F7'])
-                
-                # Send tab command
-                success = self.ketron_midi.send_tab_command(matched_key, port_name)
-                if not success:
-                    self.__logger.error(f"Failed to send tab command '{matched_key}' for key {self.key_no}")
-                    # Flash with red background for failure (error message will be shown during flash)
-                    self._flash_key_with_error('red', "SEND\nFAILED")
-                else:
-                    self.__logger.info(f"Sent tab command '{matched_key}' for key {self.key_no}")
-                    # Flash with white background for success
-                    self._flash_key('white')
-                    # Notify GUI of key press with MIDI hex
-                    if _GUI_AVAILABLE and put_key_press:
-                        try:
-                            put_key_press(self.key_no, key_name, midi_hex)
-                        except Exception:
-                            pass  # GUI not available, continue normally
+            # SysEx ON message as "F0 .. F7" hex for GUI display
+            sysex_data = format_sysex(matched_key, on_state=True)
+            resolved = (matched_key, 'F0 ' + sysex_data.hex(' ').upper() + ' F7')
+            self._resolved = (self.key_mapping, resolved)
+        matched_key, midi_hex = resolved
+        
+        # Send pedal/tab command
+        success = send_command(matched_key, port_name)
+        if not success:
+            self.__logger.error("Failed to send %s command '%s' for key %s", kind, matched_key, self.key_no)
+            # Flash with red background for failure (error message will be shown during flash)
+            self._flash_key_with_error('red', "SEND\nFAILED")
+        else:
+            self.__logger.info("Sent %s command '%s' for key %s", kind, matched_key, self.key_no)
+            # Flash with white background for success
+            self._flash_key('white')
+            # Notify GUI of key press with MIDI hex
+            if _GUI_AVAILABLE and put_key_press:
+                try:
+                    put_key_press(self.key_no, key_name, midi_hex)
+                except Exception:
+                    pass  # GUI not available, continue normally
+    
+    def _send_cc(self, key_name, port_name):
+        """Send a cc_midis CC message"""
+        resolved = self._resolved_for(self.key_mapping)
+        if resolved is None:
+            # For CC buttons, find the matching key (case-insensitive)
+            matched_key = self._find_key_in_dict(key_name, self.ketron_midi.cc_midis)
+            if matched_key is None:
+                self.__logger.error("Key name '%s' not found in cc_midis for key %s", key_name, self.key_no)
+                self._render_error("INVALID\nKEY")
+                return
             
-            elif source_list_name == 'cc_midis':
-                # For CC buttons, find the matching key (case-insensitive)
-                matched_key = self._find_key_in_dict(key_name, self.ketron_midi.cc_midis)
-                if matched_key is None:
-                    self.__logger.error(f"Key name '{key_name}' not found in cc_midis for key {self.key_no}")
-                    self._render_error("INVALID\nKEY")
-                    return
-                
-                # Track this as the last pressed volume key for volume manager
-                # This allows increment/decrement to know which volume to adjust
-                self.volume_manager.set_last_pressed_key_name(matched_key)
-                self.__logger.debug(f"Tracked last pressed volume key: {matched_key} for key {self.key_no}")
-                
-                cc_control = self.ketron_midi.cc_midis[matched_key]
-                
-                # Check if this is a volume button - if so, send current volume value on channel 16
-                # Convert to uppercase for lookup since _key_name_to_volume uses uppercase keys
-                volume_name = self.volume_manager._key_name_to_volume.get(matched_key.upper())
-                if volume_name:
-                    # This is a volume button - send current volume value on channel 16
-                    # Use property getter to get current volume
-                    current_volume = getattr(self.volume_manager, volume_name)
-                    cc_value = current_volume
-                    cc_channel = 15  # Channel 16 (0-indexed: 15)
-                    self.__logger.debug(f"Volume button '{matched_key}' pressed - sending current volume {current_volume} on channel 16")
-                else:
-                    # Not a volume button - use settings or default
-                    cc_value = self.settings.get('cc_value', 64)  # Default to middle value
-                    cc_channel = self.settings.get('cc_channel', 0)
-                
-                # Format CC message as hex for GUI display
-                # CC message format: Bn CC VV where n is channel (0-F), CC is control, VV is value
-                cc_status = 0xB0 + cc_channel  # CC status byte for channel
-                midi_hex = f'{cc_status:02X} {cc_control:02X} {cc_value:02X}'
-                
-                success = self.midi_manager.send_cc(cc_control, cc_value, cc_channel, port_name)
-                if not success:
-                    self.__logger.error(f"Failed to send CC message: control={cc_control}, value={cc_value}, channel={cc_channel}")
-                    # Flash with red background for failure (error message will be shown during flash)
-                    self._flash_key_with_error('red', "SEND\nFAILED")
-                else:
-                    if volume_name:
-                        self.__logger.info(f"Sent CC message: control={cc_control}, value={cc_value} (current {volume_name} volume), channel=16 for key {self.key_no}")
-                    else:
-                        self.__logger.info(f"Sent CC message: control={cc_control}, value={cc_value}, channel={cc_channel} for key {self.key_no}")
-                    # Flash with white background for success
-                    self._flash_key('white')
-                    # Notify GUI of key press with MIDI hex
-                    if _GUI_AVAILABLE and put_key_press:
-                        try:
-                            put_key_press(self.key_no, key_name, midi_hex)
-                        except Exception:
-                            pass  # GUI not available, continue normally
+            cc_control = self.ketron_midi.cc_midis[matched_key]
             
+            # Check if this is a volume button
+            # Convert to uppercase for lookup since _key_name_to_volume uses uppercase keys
+            volume_name = self.volume_manager._key_name_to_volume.get(matched_key.upper())
+            resolved = (matched_key, cc_control, volume_name)
+            self._resolved = (self.key_mapping, resolved)
+        matched_key, cc_control, volume_name = resolved
+        
+        # Track this as the last pressed volume key for volume manager
+        # This allows increment/decrement to know which volume to adjust
+        self.volume_manager.set_last_pressed_key_name(matched_key)
+        self.__logger.debug("Tracked last pressed volume key: %s for key %s", matched_key, self.key_no)
+        
+        # If this is a volume button, send current volume value on channel 16
+        if volume_name:
+            # This is a volume button - send current volume value on channel 16
+            # Use property getter to get current volume
+            current_volume = getattr(self.volume_manager, volume_name)
+            cc_value = current_volume
+            cc_channel = _VOLUME_CC_CHANNEL
+            self.__logger.debug("Volume button '%s' pressed - sending current volume %s on channel 16", matched_key, current_volume)
+        else:
+            # Not a volume button - use settings or default
+            cc_value = self._cc_value
+            cc_channel = self._cc_channel
+        
+        success = self.midi_manager.send_cc(cc_control, cc_value, cc_channel, port_name)
+        if not success:
+            self.__logger.error("Failed to send CC message: control=%s, value=%s, channel=%s", cc_control, cc_value, cc_channel)
+            # Flash with red background for failure (error message will be shown during flash)
+            self._flash_key_with_error('red', "SEND\nFAILED")
+        else:
+            if volume_name:
+                self.__logger.info("Sent CC message: control=%s, value=%s (current %s volume), channel=16 for key %s", cc_control, cc_value, volume_name, self.key_no)
             else:
-                self.__logger.error(f"Invalid source_list_name '{source_list_name}' for key {self.key_no}")
-                self._render_error("INVALID\nSOURCE")
-        
-        except Exception as e:
-            self.__logger.error(f"Error sending MIDI message for key {self.key_no}: {e}", exc_info=True)
-            self._render_error("ERROR")
+                self.__logger.info("Sent CC message: control=%s, value=%s, channel=%s for key %s", cc_control, cc_value, cc_channel, self.key_no)
+            # Flash with white background for success
+            self._flash_key('white')
+            # Notify GUI of key press with MIDI hex
+            if _GUI_AVAILABLE and put_key_press:
+                try:
+                    # CC message format: Bn CC VV where n is channel (0-F), CC is control, VV is value
+                    put_key_press(self.key_no, key_name, _format_cc_hex(cc_channel, cc_control, cc_value))
+                except Exception:
+                    pass  # GUI not available, continue normally
+    
+    # Handlers for keys that work regardless of source_list_name, by upper-cased key_name
+    _SPECIAL_HANDLERS = {
+        "VOLUME UP": _handle_volume_up,
+        "VOLUME DOWN": _handle_volume_down,
+        "MUTE": _handle_mute,
+    }
+    
+    # Handlers for all other keys, by source_list_name
+    _SOURCE_HANDLERS = {
+        'pedal_midis': _send_pedal,
+        'tab_midis': _send_tab,
+        'cc_midis': _send_cc,
+    }
+    
+    # Handlers whose key repeats while held
+    _REPEATING_HANDLERS = (_handle_volume_up, _handle_volume_down)
     
     def released(self):
-        """Handle key release, including stopping volume key repeat if applicable"""
+        """Handle key release (on the key event worker thread, after the press)"""
+        _queue_key_event(self._handle_release)
+    
+    def _handle_release(self):
+        """Stop volume key repeat if applicable and restore the key image"""
         # Re-fetch the mapping to check if this is a Volume Up/Down key
-        lookup_key = getattr(self, 'offset_key_no', self.key_no)
         self.key_mapping = self._get_key_mapping()
         
-        if self.key_mapping is not None:
-            key_name = self.key_mapping.get('key_name', '').strip()
-            
-            # Stop repeat thread for Volume Up/Down keys
-            if key_name.upper() in ("VOLUME UP", "VOLUME DOWN"):
-                self._stop_volume_key_repeat()
+        # Stop repeat thread for Volume Up/Down keys
+        if self.key_mapping is not None and self.key_mapping.handler in self._REPEATING_HANDLERS:
+            self._stop_volume_key_repeat()
         
-        # Re-render on key release to ensure image stays visible
-        self._render()
+        # Re-render on key release to ensure image stays visible, unless the key
+        # already shows this mapping's normal image (e.g. the flash has been restored)
+        # or a pending flash restore is about to draw it anyway
+        if self.key_mapping is not self._rendered_mapping and not self._restore_pending():
+            self._render()
+    
+    def dispose(self):
+        """
+        Cancel any pending flash restore, send pending key-release SysEx and stop the
+        key event worker before the control is dropped
+        """
+        # A flash restore firing after this would draw over whatever replaces this control
+        if self._restore_timer is not None:
+            self._restore_timer.cancel()
+        self.ketron_midi.flush()
+        _stop_key_events()
+        super().dispose()
     
     def settings_schema(self):
         """Define the settings schema for KetronKeyMappingControl"""
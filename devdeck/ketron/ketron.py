@@ -1,5 +1,17 @@
 # Manage Control Panel Volume Sliders via midi CC
 
+import heapq
+import itertools
+import logging
+import threading
+import time
+from enum import IntEnum
+from types import MappingProxyType
+
+from devdeck.midi import MidiManager
+
+_LOG = logging.getLogger('devdeck')
+
 # Ketron SysEx message format constants
 # Based on working CircuitPython implementation
 KETRON_SYSEX_MANUFACTURER_ID_PEDAL = [0x26, 0x79]  # 2-byte manufacturer ID for pedal commands
@@ -29,7 +41,7 @@ class SliderCC:
     MICRO1_CC = 0x75
     VOCAL_CC = 0x76
 
-class Colors:
+class Colors(IntEnum):
     WHITE = 0x606060
     BLUE = 0x000020
     KETRON_BLUE = 0x0066CC  # RGB(0, 102, 204) - Bright brand blue
@@ -44,138 +56,285 @@ class Colors:
     OFFWHITE = 0xA47474
     BEIGE = 0xF1E1C3  # RGB(241, 225, 195) - Beige color
 
-# Color mapping dictionary
-COLOR_MAP = {
-    'red': Colors.RED,
-    'green': Colors.GREEN,
-    'bright_green': Colors.BRIGHT_GREEN,
-    'blue': Colors.BLUE,
-    'ketron_blue': Colors.KETRON_BLUE,
-    'purple': Colors.PURPLE,
-    'yellow': Colors.YELLOW,
-    'lightyellow': Colors.LIGHTYELLOW,
-    'orange': Colors.ORANGE,
-    'white': Colors.WHITE,
-    'teal': Colors.TEAL,
-    'offwhite': Colors.OFFWHITE,
-    'beige': Colors.BEIGE
-}
+# Color name -> RGB value, derived from Colors so the two can't drift apart
+# (keys are the lower-cased member names, e.g. 'ketron_blue')
+COLOR_MAP = MappingProxyType({name.lower(): color.value for name, color in Colors.__members__.items()})
+
+# COLOR_MAP with each value already formatted as the "#RRGGBB" string the key renderer takes
+COLOR_HEX = MappingProxyType({name: f"#{value:06X}" for name, value in COLOR_MAP.items()})
+
+# Color names the renderer understands itself; anything else is looked up in COLOR_HEX
+_STANDARD_COLORS = frozenset((
+    'blue', 'green', 'red', 'yellow', 'orange', 'purple', 'white', 'black', 'grey', 'gray',
+    'cyan', 'magenta', 'pink', 'brown', 'teal', 'navy', 'maroon', 'lime', 'silver', 'gold',
+    'lightblue', 'lightgreen', 'lightgray', 'darkblue', 'darkgreen', 'darkred'
+))
+
+
+def resolve_color(color):
+    """
+    Map a custom color name (e.g. 'ketron_blue', any case) to its "#RRGGBB" value.
+    
+    Standard color names, which the renderer understands itself, and unknown
+    names are returned unchanged.
+    """
+    color_lower = color.lower()
+    if color_lower in _STANDARD_COLORS:
+        return color
+    return COLOR_HEX.get(color_lower, color)
+
+# Ketron Pedal, Tab and CC MIDI lookup tables. These are shared, read-only
+# module constants: every KetronMidi references the same mappings.
+_PEDAL_MIDIS = MappingProxyType({
+    "Sustain": 0x00, "Soft": 0x01, "Sostenuto": 0x02, "Arr.A": 0x03,
+    "Arr.B": 0x04, "Arr.C": 0x05, "Arr.D": 0x06, "Fill1": 0x07,
+    "Fill2": 0x08, "Fill3": 0x09, "Fill4": 0x0A, "Break1": 0x0B,
+    "Break2": 0x0C, "Break3": 0x0D, "Break4": 0x0E, "Intro/End1": 0x0F,
+    "Intro/End2": 0x10, "Intro/End3": 0x11, "Start/Stop": 0x12,
+    "Tempo Up": 0x13, "Tempo Down": 0x14, "Fill": 0x15, "Break": 0x16,
+    "To End": 0x17, "Bass to Lowest": 0x18, "Bass to Root": 0x19,
+    "Live Bass": 0x1A, "Acc.BassToChord": 0x1B, "Manual Bass": 0x1C,
+    "Voice Lock Bass": 0x1D, "Bass Mono/Poly": 0x1E, "Dial Down": 0x20,
+    "Dial Up": 0x1F, "Auto Fill": 0x21, "Fill to Arr.": 0x22,
+    "After Fill": 0x23, "Low. Hold Start": 0x24, "Low. Hold Stop": 0x25,
+    "Low. Hold Break": 0x26, "Low. Stop Mute": 0x27, "Low. Mute": 0x28,
+    "Low. and Bass": 0x29, "Low. Voice Lock": 0x2A, "Pianist": 0x2B,
+    "Pianist Auto/Stand.": 0x2C, "Pianist Sustain": 0x2D, "Bassist": 0x2E,
+    "Bassist Easy/Exp.": 0x2F, "Key Start": 0x30, "Key Stop": 0x31,
+    "Enter": 0x32, "Exit": 0x33, "Registration": 0x34, "Fade": 0x35,
+    "Harmony": 0x36, "Octave Up": 0x37, "Octave Down": 0x38,
+    "RestartCount In": 0x39, "Micro1 On/Off": 0x3A, "Micro1 Down": 0x3B,
+    "Micro1 Up": 0x3C, "Voicetr.On/Off": 0x3D, "Voicetr.Down": 0x3E,
+    "Voicetr.Up": 0x3F, "Micro2 On/Off": 0x40, "EFX1 On/Off": 0x41,
+    "EFX2 On/Off": 0x42, "Arabic.Set1": 0x43, "Arabic.Set2": 0x44,
+    "Arabic.Set3": 0x45, "Arabic.Set4": 0x46, "Dry On Stop": 0x47,
+    "Pdf Page Down": 0x48, "Pdf Page Up": 0x49, "Pdf Scroll Down": 0x4A,
+    "Pdf Scroll Up": 0x4B, "Glide Down": 0x4C, "Lead Mute": 0x4D,
+    "Expr. Left/Style": 0x4E, "Arabic Reset": 0x4F, "Hold": 0x50,
+    "2nd On/Off": 0x51, "Pause": 0x52, "Talk On/Off": 0x53,
+    "Manual Drum": 0x54, "Kick Off": 0x55, "Snare Off": 0x56,
+    "Rimshot Off": 0x57, "Hit-Hat Off": 0x58, "Cymbal Off": 0x59,
+    "Tom Off": 0x5A, "Latin1 Off": 0x5B, "Latin2 Off": 0x5C,
+    "Latin3/Tamb Off": 0x5D, "Clap/fx Off": 0x5E, "Voice Down": 0x5F,
+    "Voice Up": 0x60, "Regis Down": 0x61, "Regis Up": 0x62,
+    "Style Voice Down": 0x63, "Style Voice Up": 0x64, "EFX1 Preset Down": 0x65,
+    "EFX1 Preset Up": 0x66, "Multi": 0x67, "Page<<": 0x68, "Page>>": 0x69,
+    "RegisVoice<<": 0x6A, "RegisVoice>>": 0x6B, "Text Page": 0x6E,
+    "Text Page+": 0x6F, "Style Voice 1": 0x70, "Style Voice 2": 0x71,
+    "Style Voice 3": 0x72, "Style Voice 4": 0x73, "VIEW & MODELING": 0x74,
+    "Lock Bass": 0x75, "LockChord": 0x76, "Lyrics": 0x77,
+    "VoiceToABCD": 0x87, "TAP": 0x88, "Autocrash": 0x89,
+    "Transp Down": 0x8A, "Transp Up": 0x8B, "Text Record": 0x8C,
+    "Bass & Drum": 0x8D, "Pdf Clear": 0x8E, "Record": 0x90, "Play": 0x91,
+    "DoubleDown": 0x92, "DoubleUp": 0x93, "Arr.Off": 0x94,
+    "FILL & DRUM IN": 0x95, "Wah to Pedal": 0x96, "Overdrive to Pedal": 0x98,
+    "Drum Mute": 0x99, "Bass Mute": 0x9A, "Chords Mute": 0x9B,
+    "Real Chords Mute": 0x9C, "Voice2 to Pedal": 0x9D, "Micro Edit": 0x9E,
+    "Micro2 Edit": 0x9F, "HALF BAR": 0xA0, "Bs Sust Pedal": 0xA1,
+    "Scale": 0xA2, "End Swap": 0xA3, "Set Down": 0xA4, "Set Up": 0xA5,
+    "FswChDelay": 0xA6, "IntroOnArr.": 0xA7, "EndingOnArr.": 0xA8,
+    "Arr. Down": 0xA9, "Arr. Up": 0xAA, "Ending1": 0xAB, "Ending2": 0xAC,
+    "Ending3": 0xAD, "Bass Lock": 0xAE, "Intro Loop": 0xB0,
+    "Scene Down": 0xB1, "Scene Up": 0xB2, "STEM Scene A": 0xB3,
+    "STEM Scene B": 0xB4, "STEM Scene C": 0xB5, "STEM Scene D": 0xB6,
+    "STEM Solo": 0xB7, "STEM Autoplay": 0xB8, "STEM A On/Off": 0xB9,
+    "STEM B On/Off": 0xBA, "STEM C On/Off": 0xBB, "STEM D On/Off": 0xBC,
+    "STEM Lead On/Off": 0xBD, "Art. Toggle": 0xBE, "Key Tune On/Off": 0xBF,
+    "Txt Clear": 0xC0, "Voicetr. Edit": 0xC1, "Clear Image": 0xC2
+})
+
+_TAB_MIDIS = MappingProxyType({
+    "DIAL_DOWN": 0x0, "DIAL_UP": 0x1, "PLAYER_A": 0x2, "PLAYER_B": 0x3,
+    "ENTER": 0x4, "MENU": 0x6, "LYRIC": 0x7, "LEAD": 0x8, "VAR": 0x9,
+    "DRAWBARS_VIEW": 0x0a, "DRAWBARS": 0x10, "DRUMSET": 0x11, "TALK": 0x12,
+    "VOICETRON": 0x13, "STYLE_BOX": 0x14, "VOICE1": 0x19, "VOICE2": 0x1a,
+    "USER_VOICE": 0x1b, "XFADE": 0x1c, "INTRO1": 0x1d, "INTRO2": 0x1e,
+    "INTRO3": 0x1f, "BASSIST": 0x20, "DRUM_MIXER": 0x22, "OCTAVE_UP": 0x24,
+    "OCTAVE_DOWN": 0x25, "USER_STYLE": 0x26, "DSP": 0x27, "ADSR_FILTER": 0x28,
+    "MICRO": 0x29, "ARRA": 0x2c, "ARRB": 0x2d, "ARRC": 0x2e, "ARRD": 0x2f,
+    "FILL": 0x30, "BREAK": 0x31, "JUKE_BOX": 0x32, "STEM": 0x33,
+    "PIANIST": 0x34, "BASS_TO_LOWEST": 0x40, "MANUAL_BASS": 0x41,
+    "PORTAMENTO": 0x48, "HARMONY": 0x49, "PAUSE": 0x4a, "TEMPO_SLOW": 0x4b,
+    "TEMPO_FAST": 0x4c, "START_STOP": 0x4d, "TRANSP_DOWN": 0x59,
+    "TRANSP_UP": 0x5a, "AFTERTOUCH": 0x5e, "EXIT": 0x5f, "ROTOR_SLOW": 0x60,
+    "ROTOR_FAST": 0x61, "PIANO_FAM": 0x62, "ETHNIC_FAM": 0x63,
+    "ORGAN_FAM": 0x64, "GUITAR_FAM": 0x65, "BASS_FAM": 0x66,
+    "STRING_FAM": 0x67, "BRASS_FAM": 0x68, "SAX_FAM": 0x69, "HOLD": 0x6f,
+    "PAD_FAM": 0x70, "SYNTH_FAM": 0x71, "FADEOUT": 0x73, "BASS_TO_ROOT": 0x74,
+    "GM": 0x77
+})
+
+_CC_MIDIS = MappingProxyType({
+    "PLAYER": SliderCC.PLAYER_CC, "STYLE": SliderCC.STYLE_CC, "Style": SliderCC.STYLE_CC, "DRUM": SliderCC.DRUM_CC, "Drums": SliderCC.DRUM_CC, 
+    "CHORD": SliderCC.CHORD_CC, "Chords": SliderCC.CHORD_CC,             "REALCHORD": SliderCC.REALCHORD_CC, 
+    "REAL CHORD": SliderCC.REALCHORD_CC,  # Alias for REALCHORD
+    "Real Chords": SliderCC.REALCHORD_CC,
+    "BASS": SliderCC.BASS_CC, "Bass": SliderCC.BASS_CC, "LOWERS": SliderCC.LOWERS_CC, "USER2": SliderCC.USER2_CC, "USER3": SliderCC.USER3_CC, 
+    "VOICE1": SliderCC.VOICE1_CC, "VOICE2": SliderCC.VOICE2_CC, "drawbars": SliderCC.DRAWBARS_CC,
+    "Draw Organ": SliderCC.DRAWBARS_CC,  # Alias for drawbars
+    "MICRO1": SliderCC.MICRO1_CC, "VOCAL": SliderCC.VOCAL_CC
+})
+
+
+
+def _by_value(table):
+    """Reverse a name -> value table; where names alias one value, the first listed name wins"""
+    reverse = {}
+    for name, value in table.items():
+        reverse.setdefault(value, name)
+    return MappingProxyType(reverse)
+
+
+# MIDI value -> name, for decoding incoming values; indexed by SourceList
+_PEDAL_BY_VALUE = _by_value(_PEDAL_MIDIS)
+_TAB_BY_VALUE = _by_value(_TAB_MIDIS)
+_CC_BY_VALUE = _by_value(_CC_MIDIS)
+_BY_VALUE = (_PEDAL_BY_VALUE, _TAB_BY_VALUE, _CC_BY_VALUE)
+
+
+def _build_pedal_sysex(pedal_value: int, state_value: int) -> bytes:
+    """Build the SysEx data bytes (excluding 0xF0 and 0xF7) for a pedal command"""
+    # Ketron SysEx format for pedal commands (based on working CircuitPython implementation):
+    # For values < 128: F0 26 79 03 [command_byte] [state_value] F7
+    # For values >= 128: F0 26 79 05 [high_byte] [low_byte] [state_value] F7
+    # Manufacturer ID: [0x26, 0x79] (2-byte manufacturer ID for pedals)
+    # Type byte: 0x03 for values < 128, 0x05 for values >= 128
+    # state_value: 0x7F (127) for ON, 0x00 (0) for OFF
+    # Values >= 128 are split into two 7-bit bytes (high byte and low byte)
+    if pedal_value < 128:
+        # Standard format: manufacturer (2 bytes), type (0x03), command, state
+        return bytes(KETRON_SYSEX_MANUFACTURER_ID_PEDAL + [KETRON_SYSEX_PEDAL_TYPE, pedal_value, state_value])
+    # Extended format: manufacturer (2 bytes), type (0x05), high_byte, low_byte, state
+    high_byte = (pedal_value >> 7) & 0x7F
+    low_byte = pedal_value & 0x7F
+    return bytes(KETRON_SYSEX_MANUFACTURER_ID_PEDAL + [0x05, high_byte, low_byte, state_value])
+
+
+def _build_tab_sysex(tab_value: int, state_value: int) -> bytes:
+    """Build the SysEx data bytes (excluding 0xF0 and 0xF7) for a tab command"""
+    # Ketron SysEx format for tab commands (based on working CircuitPython implementation):
+    # F0 26 7C [command_byte] [state_value] F7
+    # Manufacturer ID: [0x26, 0x7C] (2-byte manufacturer ID for tabs)
+    # state_value: 0x7F (127) for ON, 0x00 (0) for OFF
+    return bytes(KETRON_SYSEX_MANUFACTURER_ID_TAB + [tab_value, state_value])
+
+
+# Every pedal/tab SysEx message, prebuilt once so a key press is a single lookup;
+# the 7-bit high/low split of extended (>= 128) pedal values also happens only here
+_PEDAL_SYSEX_ON = MappingProxyType({name: _build_pedal_sysex(value, KETRON_SYSEX_ON_VALUE) for name, value in _PEDAL_MIDIS.items()})
+_PEDAL_SYSEX_OFF = MappingProxyType({name: _build_pedal_sysex(value, KETRON_SYSEX_OFF_VALUE) for name, value in _PEDAL_MIDIS.items()})
+_TAB_SYSEX_ON = MappingProxyType({name: _build_tab_sysex(value, KETRON_SYSEX_ON_VALUE) for name, value in _TAB_MIDIS.items()})
+_TAB_SYSEX_OFF = MappingProxyType({name: _build_tab_sysex(value, KETRON_SYSEX_OFF_VALUE) for name, value in _TAB_MIDIS.items()})
+
+
+def _framed(table):
+    """Wrap every message in a prebuilt table with its 0xF0/0xF7 framing"""
+    return MappingProxyType({name: b'\xF0' + data + b'\xF7' for name, data in table.items()})
+
+
+# Complete on-the-wire messages for MidiManager.send_sysex_raw
+_PEDAL_SYSEX_ON_RAW = _framed(_PEDAL_SYSEX_ON)
+_PEDAL_SYSEX_OFF_RAW = _framed(_PEDAL_SYSEX_OFF)
+_TAB_SYSEX_ON_RAW = _framed(_TAB_SYSEX_ON)
+_TAB_SYSEX_OFF_RAW = _framed(_TAB_SYSEX_OFF)
+
+
+# KetronMidi._opened_port value when no port has been opened yet
+_NO_PORT = object()
+
+
+class _OffScheduler:
+    """
+    Runs the delayed OFF halves of key presses on one thread, earliest due first.
+    
+    The thread exits once it has been idle for IDLE_TIMEOUT seconds, so shutdown
+    (which joins every live thread) isn't kept waiting on it, and the next
+    scheduled call starts it again.
+    """
+    IDLE_TIMEOUT = 1.0
+    
+    def __init__(self):
+        # (due time, sequence number, callback, args); the sequence number keeps
+        # calls due at the same moment in the order they were scheduled
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+    
+    def call_later(self, delay: float, callback, *args):
+        """Call callback(*args) on the scheduler thread after delay seconds"""
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), callback, args))
+            if self._running:
+                self._cond.notify()
+                return
+            self._running = True
+        threading.Thread(target=self._run, name='ketron-sysex-off', daemon=True).start()
+    
+    def _run(self):
+        """Scheduler thread: make each call when it falls due, exiting when idle"""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait(self.IDLE_TIMEOUT)
+                        if not self._heap:
+                            self._running = False
+                            return
+                        continue
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        _due, _seq, callback, args = heapq.heappop(self._heap)
+                        break
+                    self._cond.wait(wait)
+            try:
+                callback(*args)
+            except Exception as e:
+                _LOG.error("Scheduled MIDI call %s raised an exception: %s", callback, e, exc_info=True)
+
+
+# Shared by every KetronMidi, so key presses don't each start a timer thread
+_OFF_SCHEDULER = _OffScheduler()
+
 
 class KetronMidi:
     def __init__(self):
         # Ketron Pedal and Tab MIDI lookup dictionaries
-        self.pedal_midis = self._init_pedal_midis()
-        self.tab_midis = self._init_tab_midis()
-        self.cc_midis = self._init_cc_midis()
-
-        self._build_cache()
-
-    def _build_cache(self):
-        """Build lookup cache - placeholder for compatibility"""
-        # This method can be used for caching lookups if needed
-        # For now, it's a no-op to maintain compatibility
-        pass
-
-    def _init_pedal_midis(self):
-        """Initialize pedal MIDI dictionary"""
-        
-        return {
-            "Sustain": 0x00, "Soft": 0x01, "Sostenuto": 0x02, "Arr.A": 0x03,
-            "Arr.B": 0x04, "Arr.C": 0x05, "Arr.D": 0x06, "Fill1": 0x07,
-            "Fill2": 0x08, "Fill3": 0x09, "Fill4": 0x0A, "Break1": 0x0B,
-            "Break2": 0x0C, "Break3": 0x0D, "Break4": 0x0E, "Intro/End1": 0x0F,
-            "Intro/End2": 0x10, "Intro/End3": 0x11, "Start/Stop": 0x12,
-            "Tempo Up": 0x13, "Tempo Down": 0x14, "Fill": 0x15, "Break": 0x16,
-            "To End": 0x17, "Bass to Lowest": 0x18, "Bass to Root": 0x19,
-            "Live Bass": 0x1A, "Acc.BassToChord": 0x1B, "Manual Bass": 0x1C,
-            "Voice Lock Bass": 0x1D, "Bass Mono/Poly": 0x1E, "Dial Down": 0x20,
-            "Dial Up": 0x1F, "Auto Fill": 0x21, "Fill to Arr.": 0x22,
-            "After Fill": 0x23, "Low. Hold Start": 0x24, "Low. Hold Stop": 0x25,
-            "Low. Hold Break": 0x26, "Low. Stop Mute": 0x27, "Low. Mute": 0x28,
-            "Low. and Bass": 0x29, "Low. Voice Lock": 0x2A, "Pianist": 0x2B,
-            "Pianist Auto/Stand.": 0x2C, "Pianist Sustain": 0x2D, "Bassist": 0x2E,
-            "Bassist Easy/Exp.": 0x2F, "Key Start": 0x30, "Key Stop": 0x31,
-            "Enter": 0x32, "Exit": 0x33, "Registration": 0x34, "Fade": 0x35,
-            "Harmony": 0x36, "Octave Up": 0x37, "Octave Down": 0x38,
-            "RestartCount In": 0x39, "Micro1 On/Off": 0x3A, "Micro1 Down": 0x3B,
-            "Micro1 Up": 0x3C, "Voicetr.On/Off": 0x3D, "Voicetr.Down": 0x3E,
-            "Voicetr.Up": 0x3F, "Micro2 On/Off": 0x40, "EFX1 On/Off": 0x41,
-            "EFX2 On/Off": 0x42, "Arabic.Set1": 0x43, "Arabic.Set2": 0x44,
-            "Arabic.Set3": 0x45, "Arabic.Set4": 0x46, "Dry On Stop": 0x47,
-            "Pdf Page Down": 0x48, "Pdf Page Up": 0x49, "Pdf Scroll Down": 0x4A,
-            "Pdf Scroll Up": 0x4B, "Glide Down": 0x4C, "Lead Mute": 0x4D,
-            "Expr. Left/Style": 0x4E, "Arabic Reset": 0x4F, "Hold": 0x50,
-            "2nd On/Off": 0x51, "Pause": 0x52, "Talk On/Off": 0x53,
-            "Manual Drum": 0x54, "Kick Off": 0x55, "Snare Off": 0x56,
-            "Rimshot Off": 0x57, "Hit-Hat Off": 0x58, "Cymbal Off": 0x59,
-            "Tom Off": 0x5A, "Latin1 Off": 0x5B, "Latin2 Off": 0x5C,
-            "Latin3/Tamb Off": 0x5D, "Clap/fx Off": 0x5E, "Voice Down": 0x5F,
-            "Voice Up": 0x60, "Regis Down": 0x61, "Regis Up": 0x62,
-            "Style Voice Down": 0x63, "Style Voice Up": 0x64, "EFX1 Preset Down": 0x65,
-            "EFX1 Preset Up": 0x66, "Multi": 0x67, "Page<<": 0x68, "Page>>": 0x69,
-            "RegisVoice<<": 0x6A, "RegisVoice>>": 0x6B, "Text Page": 0x6E,
-            "Text Page+": 0x6F, "Style Voice 1": 0x70, "Style Voice 2": 0x71,
-            "Style Voice 3": 0x72, "Style Voice 4": 0x73, "VIEW & MODELING": 0x74,
-            "Lock Bass": 0x75, "LockChord": 0x76, "Lyrics": 0x77,
-            "VoiceToABCD": 0x87, "TAP": 0x88, "Autocrash": 0x89,
-            "Transp Down": 0x8A, "Transp Up": 0x8B, "Text Record": 0x8C,
-            "Bass & Drum": 0x8D, "Pdf Clear": 0x8E, "Record": 0x90, "Play": 0x91,
-            "DoubleDown": 0x92, "DoubleUp": 0x93, "Arr.Off": 0x94,
-            "FILL & DRUM IN": 0x95, "Wah to Pedal": 0x96, "Overdrive to Pedal": 0x98,
-            "Drum Mute": 0x99, "Bass Mute": 0x9A, "Chords Mute": 0x9B,
-            "Real Chords Mute": 0x9C, "Voice2 to Pedal": 0x9D, "Micro Edit": 0x9E,
-            "Micro2 Edit": 0x9F, "HALF BAR": 0xA0, "Bs Sust Pedal": 0xA1,
-            "Scale": 0xA2, "End Swap": 0xA3, "Set Down": 0xA4, "Set Up": 0xA5,
-            "FswChDelay": 0xA6, "IntroOnArr.": 0xA7, "EndingOnArr.": 0xA8,
-            "Arr. Down": 0xA9, "Arr. Up": 0xAA, "Ending1": 0xAB, "Ending2": 0xAC,
-            "Ending3": 0xAD, "Bass Lock": 0xAE, "Intro Loop": 0xB0,
-            "Scene Down": 0xB1, "Scene Up": 0xB2, "STEM Scene A": 0xB3,
-            "STEM Scene B": 0xB4, "STEM Scene C": 0xB5, "STEM Scene D": 0xB6,
-            "STEM Solo": 0xB7, "STEM Autoplay": 0xB8, "STEM A On/Off": 0xB9,
-            "STEM B On/Off": 0xBA, "STEM C On/Off": 0xBB, "STEM D On/Off": 0xBC,
-            "STEM Lead On/Off": 0xBD, "Art. Toggle": 0xBE, "Key Tune On/Off": 0xBF,
-            "Txt Clear": 0xC0, "Voicetr. Edit": 0xC1, "Clear Image": 0xC2
-        }
-
-    def _init_tab_midis(self):
-        """Initialize tab MIDI dictionary"""
-        
-        return {
-            "DIAL_DOWN": 0x0, "DIAL_UP": 0x1, "PLAYER_A": 0x2, "PLAYER_B": 0x3,
-            "ENTER": 0x4, "MENU": 0x6, "LYRIC": 0x7, "LEAD": 0x8, "VAR": 0x9,
-            "DRAWBARS_VIEW": 0x0a, "DRAWBARS": 0x10, "DRUMSET": 0x11, "TALK": 0x12,
-            "VOICETRON": 0x13, "STYLE_BOX": 0x14, "VOICE1": 0x19, "VOICE2": 0x1a,
-            "USER_VOICE": 0x1b, "XFADE": 0x1c, "INTRO1": 0x1d, "INTRO2": 0x1e,
-            "INTRO3": 0x1f, "BASSIST": 0x20, "DRUM_MIXER": 0x22, "OCTAVE_UP": 0x24,
-            "OCTAVE_DOWN": 0x25, "USER_STYLE": 0x26, "DSP": 0x27, "ADSR_FILTER": 0x28,
-            "MICRO": 0x29, "ARRA": 0x2c, "ARRB": 0x2d, "ARRC": 0x2e, "ARRD": 0x2f,
-            "FILL": 0x30, "BREAK": 0x31, "JUKE_BOX": 0x32, "STEM": 0x33,
-            "PIANIST": 0x34, "BASS_TO_LOWEST": 0x40, "MANUAL_BASS": 0x41,
-            "PORTAMENTO": 0x48, "HARMONY": 0x49, "PAUSE": 0x4a, "TEMPO_SLOW": 0x4b,
-            "TEMPO_FAST": 0x4c, "START_STOP": 0x4d, "TRANSP_DOWN": 0x59,
-            "TRANSP_UP": 0x5a, "AFTERTOUCH": 0x5e, "EXIT": 0x5f, "ROTOR_SLOW": 0x60,
-            "ROTOR_FAST": 0x61, "PIANO_FAM": 0x62, "ETHNIC_FAM": 0x63,
-            "ORGAN_FAM": 0x64, "GUITAR_FAM": 0x65, "BASS_FAM": 0x66,
-            "STRING_FAM": 0x67, "BRASS_FAM": 0x68, "SAX_FAM": 0x69, "HOLD": 0x6f,
-            "PAD_FAM": 0x70, "SYNTH_FAM": 0x71, "FADEOUT": 0x73, "BASS_TO_ROOT": 0x74,
-            "GM": 0x77
-        }
-
-    def _init_cc_midis(self):
-        """Initialize MIDI CC dictionary"""
-        
-        return {
-            "PLAYER": SliderCC.PLAYER_CC, "STYLE": SliderCC.STYLE_CC, "Style": SliderCC.STYLE_CC, "DRUM": SliderCC.DRUM_CC, "Drums": SliderCC.DRUM_CC, 
-            "CHORD": SliderCC.CHORD_CC, "Chords": SliderCC.CHORD_CC,             "REALCHORD": SliderCC.REALCHORD_CC, 
-            "REAL CHORD": SliderCC.REALCHORD_CC,  # Alias for REALCHORD
-            "Real Chords": SliderCC.REALCHORD_CC,
-            "BASS": SliderCC.BASS_CC, "Bass": SliderCC.BASS_CC, "LOWERS": SliderCC.LOWERS_CC, "USER2": SliderCC.USER2_CC, "USER3": SliderCC.USER3_CC, 
-            "VOICE1": SliderCC.VOICE1_CC, "VOICE2": SliderCC.VOICE2_CC, "drawbars": SliderCC.DRAWBARS_CC,
-            "Draw Organ": SliderCC.DRAWBARS_CC,  # Alias for drawbars
-            "MICRO1": SliderCC.MICRO1_CC, "VOCAL": SliderCC.VOCAL_CC
-        }
+        self.pedal_midis = _PEDAL_MIDIS
+        self.tab_midis = _TAB_MIDIS
+        self.cc_midis = _CC_MIDIS
+        # MidiManager singleton, fetched on first send so that constructing
+        # KetronMidi (e.g. during GUI start-up) doesn't initialise MIDI
+        self._midi = None
+        # Port most recently opened/sent on, so is_port_open isn't queried on every key press.
+        # None is a valid port_name (first open port), hence the separate "nothing cached" marker
+        self._opened_port = _NO_PORT
+        # OFF messages waiting on their key press delay: token -> (midi, sysex_off, port_name)
+        self._pending_off = {}
+        self._pending_lock = threading.Lock()
+
+    def _midi_manager(self) -> MidiManager:
+        """Return the MidiManager singleton, caching it on first use"""
+        if self._midi is None:
+            self._midi = MidiManager()
+        return self._midi
+
+    def lookup_by_value(self, source, value: int):
+        """
+        Find the name for a MIDI value in one of the lookup tables.
+        
+        Args:
+            source: SourceList member, or "pedal_midis", "tab_midis", or "cc_midis"
+            value: Pedal/tab command value or CC number
+        
+        Returns:
+            The name (the first listed one where several share the value), or None if unknown
+        """
+        if not isinstance(source, SourceList):
+            source = _SOURCE_BY_NAME[source]
+        return _BY_VALUE[source].get(value)
     
-    def format_pedal_sysex(self, pedal_name: str, on_state: bool = True) -> list:
+    def format_pedal_sysex(self, pedal_name: str, on_state: bool = True) -> bytes:
         """
         Format a pedal command as a SysEx message.
         
@@ -184,46 +343,17 @@ class KetronMidi:
             on_state: True for ON message, False for OFF message
         
         Returns:
-            List of bytes for the SysEx message (excluding 0xF0 and 0xF7)
+            Bytes of the SysEx message (excluding 0xF0 and 0xF7), prebuilt at import
         
         Raises:
             KeyError: If pedal_name is not found in pedal_midis
         """
-        if pedal_name not in self.pedal_midis:
-            raise KeyError(f"Pedal '{pedal_name}' not found in pedal_midis")
-        
-        pedal_value = self.pedal_midis[pedal_name]
-        state_value = KETRON_SYSEX_ON_VALUE if on_state else KETRON_SYSEX_OFF_VALUE
-        
-        # Ketron SysEx format for pedal commands (based on working CircuitPython implementation):
-        # For values < 128: F0 26 79 03 [command_byte] [state_value] F7
-        # For values >= 128: F0 26 79 05 [high_byte] [low_byte] [state_value] F7
-        # Manufacturer ID: [0x26, 0x79] (2-byte manufacturer ID for pedals)
-        # Type byte: 0x03 for values < 128, 0x05 for values >= 128
-        # state_value: 0x7F (127) for ON, 0x00 (0) for OFF
-        # Values >= 128 are split into two 7-bit bytes (high byte and low byte)
-        
-        # Start with 2-byte manufacturer ID
-        sysex_data = list(KETRON_SYSEX_MANUFACTURER_ID_PEDAL)
-        
-        if pedal_value < 128:
-            # Standard format: manufacturer (2 bytes), type (0x03), command, state
-            sysex_data.append(KETRON_SYSEX_PEDAL_TYPE)  # 0x03
-            sysex_data.append(pedal_value)
-            sysex_data.append(state_value)
-        else:
-            # Extended format: manufacturer (2 bytes), type (0x05), high_byte, low_byte, state
-            # Split value into two 7-bit bytes
-            sysex_data.append(0x05)  # Extended type byte (for values >= 128)
-            high_byte = (pedal_value >> 7) & 0x7F
-            low_byte = pedal_value & 0x7F
-            sysex_data.append(high_byte)
-            sysex_data.append(low_byte)
-            sysex_data.append(state_value)
-        
-        return sysex_data
+        try:
+            return (_PEDAL_SYSEX_ON if on_state else _PEDAL_SYSEX_OFF)[pedal_name]
+        except KeyError:
+            raise KeyError(f"Pedal '{pedal_name}' not found in pedal_midis") from None
     
-    def format_tab_sysex(self, tab_name: str, on_state: bool = True) -> list:
+    def format_tab_sysex(self, tab_name: str, on_state: bool = True) -> bytes:
         """
         Format a tab command as a SysEx message.
         
@@ -232,26 +362,15 @@ class KetronMidi:
             on_state: True for ON message, False for OFF message
         
         Returns:
-            List of bytes for the SysEx message (excluding 0xF0 and 0xF7)
+            Bytes of the SysEx message (excluding 0xF0 and 0xF7), prebuilt at import
         
         Raises:
             KeyError: If tab_name is not found in tab_midis
         """
-        if tab_name not in self.tab_midis:
-            raise KeyError(f"Tab '{tab_name}' not found in tab_midis")
-        
-        tab_value = self.tab_midis[tab_name]
-        state_value = KETRON_SYSEX_ON_VALUE if on_state else KETRON_SYSEX_OFF_VALUE
-        
-        # Ketron SysEx format for tab commands (based on working CircuitPython implementation):
-        # F0 26 7C [command_byte] [state_value] F7
-        # Manufacturer ID: [0x26, 0x7C] (2-byte manufacturer ID for tabs)
-        # state_value: 0x7F (127) for ON, 0x00 (0) for OFF
-        sysex_data = list(KETRON_SYSEX_MANUFACTURER_ID_TAB)  # [0x26, 0x7C]
-        sysex_data.append(tab_value)
-        sysex_data.append(state_value)
-        
-        return sysex_data
+        try:
+            return (_TAB_SYSEX_ON if on_state else _TAB_SYSEX_OFF)[tab_name]
+        except KeyError:
+            raise KeyError(f"Tab '{tab_name}' not found in tab_midis") from None
     
     def send_pedal_command(self, pedal_name: str, port_name: str = None, delay: float = MIDI_MESSAGE_DELAY) -> bool:
         """
@@ -264,37 +383,15 @@ class KetronMidi:
             delay: Delay in seconds between ON and OFF messages (default: 0.01s)
         
         Returns:
-            True if both messages were sent successfully, False otherwise
+            True if the ON message was sent and the OFF message scheduled, False otherwise
         """
         try:
-            import time
-            from devdeck.midi import MidiManager
-            
-            midi = MidiManager()
-            
-            # Ensure port is open
-            if not midi.is_port_open(port_name):
-                if not midi.open_port(port_name):
-                    return False
-            
-            # Send ON message
-            sysex_on = self.format_pedal_sysex(pedal_name, on_state=True)
-            if not midi.send_sysex(sysex_on, port_name):
-                return False
-            
-            # Small delay to simulate key press duration
-            time.sleep(delay)
-            
-            # Send OFF message
-            sysex_off = self.format_pedal_sysex(pedal_name, on_state=False)
-            if not midi.send_sysex(sysex_off, port_name):
-                return False
-            
-            return True
+            return self._send(_PEDAL_SYSEX_ON_RAW[pedal_name], _PEDAL_SYSEX_OFF_RAW[pedal_name], port_name, delay)
+        except KeyError:
+            _LOG.error("Error sending pedal command: Pedal '%s' not found in pedal_midis", pedal_name)
+            return False
         except Exception as e:
-            import logging
-            logger = logging.getLogger('devdeck')
-            logger.error(f"Error sending pedal command '{pedal_name}': {e}")
+            _LOG.error("Error sending pedal command '%s': %s", pedal_name, e)
             return False
     
     def send_tab_command(self, tab_name: str, port_name: str = None, delay: float = MIDI_MESSAGE_DELAY) -> bool:
@@ -308,38 +405,64 @@ class KetronMidi:
             delay: Delay in seconds between ON and OFF messages (default: 0.01s)
         
         Returns:
-            True if both messages were sent successfully, False otherwise
+            True if the ON message was sent and the OFF message scheduled, False otherwise
         """
         try:
-            import time
-            from devdeck.midi import MidiManager
-            
-            midi = MidiManager()
-            
-            # Ensure port is open
-            if not midi.is_port_open(port_name):
-                if not midi.open_port(port_name):
-                    return False
-            
-            # Send ON message
-            sysex_on = self.format_tab_sysex(tab_name, on_state=True)
-            if not midi.send_sysex(sysex_on, port_name):
-                return False
-            
-            # Small delay to simulate key press duration
-            time.sleep(delay)
-            
-            # Send OFF message
-            sysex_off = self.format_tab_sysex(tab_name, on_state=False)
-            if not midi.send_sysex(sysex_off, port_name):
-                return False
-            
-            return True
+            return self._send(_TAB_SYSEX_ON_RAW[tab_name], _TAB_SYSEX_OFF_RAW[tab_name], port_name, delay)
+        except KeyError:
+            _LOG.error("Error sending tab command: Tab '%s' not found in tab_midis", tab_name)
+            return False
         except Exception as e:
-            import logging
-            logger = logging.getLogger('devdeck')
-            logger.error(f"Error sending tab command '{tab_name}': {e}")
+            _LOG.error("Error sending tab command '%s': %s", tab_name, e)
+            return False
+    
+    def _send(self, sysex_on: bytes, sysex_off: bytes, port_name: str, delay: float) -> bool:
+        """Open the port if needed, send the framed ON message and schedule the framed OFF message"""
+        midi = self._midi_manager()
+        
+        # Ensure port is open
+        if port_name != self._opened_port:
+            if not midi.is_port_open(port_name) and not midi.open_port(port_name):
+                return False
+            self._opened_port = port_name
+        
+        # Send ON message
+        if not midi.send_sysex_raw(sysex_on, port_name):
+            # The port may have been closed elsewhere; check it again on the next press
+            self._opened_port = _NO_PORT
             return False
+        
+        # Send the OFF message after the key press duration without blocking the caller
+        self._send_off_later(midi, sysex_off, port_name, delay)
+        return True
+    
+    def _send_off_later(self, midi, sysex_off, port_name: str, delay: float):
+        """Schedule the OFF half of a key press on the shared OFF scheduler"""
+        token = object()
+        with self._pending_lock:
+            self._pending_off[token] = (midi, sysex_off, port_name)
+        _OFF_SCHEDULER.call_later(delay, self._send_pending_off, token)
+    
+    def _send_pending_off(self, token):
+        """Scheduler callback: send a scheduled OFF message unless flush() already did"""
+        with self._pending_lock:
+            pending = self._pending_off.pop(token, None)
+        if pending is not None:
+            self._send_off(*pending)
+    
+    def _send_off(self, midi, sysex_off, port_name: str):
+        """Send one OFF message, checking the port again on the next press if it fails"""
+        if not midi.send_sysex_raw(sysex_off, port_name):
+            self._opened_port = _NO_PORT
+            _LOG.error("Failed to send scheduled SysEx OFF message")
+    
+    def flush(self):
+        """Send every scheduled OFF message now rather than when it falls due (call before shutdown)"""
+        with self._pending_lock:
+            pending = list(self._pending_off.values())
+            self._pending_off.clear()
+        for off in pending:
+            self._send_off(*off)
     
     def test_start_stop(self, port_name: str = None) -> bool:
         """
@@ -363,6 +486,7 @@ class KetronMidi:
         print(f"  OFF message: F0 {' '.join([hex(b) for b in sysex_off])} F7")
         
         success = self.send_pedal_command("Start/Stop", port_name)
+        self.flush()
         
         if success:
             print("[OK] 'Start/Stop' SysEx ON and OFF messages sent successfully!")
@@ -372,34 +496,66 @@ class KetronMidi:
         return success
 
 
+class SourceList(IntEnum):
+    """Which lookup table a key mapping comes from; indexes the _SOURCE_* tuples"""
+    PEDAL = 0
+    TAB = 1
+    CC = 2
+
+
+_SOURCE_NAMES = ("pedal_midis", "tab_midis", "cc_midis")
+_SOURCE_TABLES = (_PEDAL_MIDIS, _TAB_MIDIS, _CC_MIDIS)
+_SOURCE_TYPES = ("SysEx", "SysEx", "CC")
+
+# Source list name -> SourceList, for callers that still pass the name
+_SOURCE_BY_NAME = MappingProxyType({name: SourceList(i) for i, name in enumerate(_SOURCE_NAMES)})
+
+
 class KeyMapping:
     """Represents a mapping for a single deck key with reference to its source list"""
-    def __init__(self, key_name, midi_value, source_list_name, source_list):
+    __slots__ = ('key_name', 'midi_value', 'source_idx', 'source_list', 'message', '_repr')
+    
+    def __init__(self, key_name, midi_value, source_idx, source_list):
         """
         Args:
             key_name: The key name from the source dictionary (e.g., "Sustain", "VOICE1")
             midi_value: The MIDI value associated with this key
-            source_list_name: Name of the source list ("pedal_midis", "tab_midis", or "cc_midis")
+            source_idx: SourceList member identifying the source list
             source_list: Reference to the actual source list dictionary
         """
         self.key_name = key_name
         self.midi_value = midi_value
-        self.source_list_name = source_list_name
+        self.source_idx = source_idx
         self.source_list = source_list
+        # Mappings don't change once built, so the message is built once and shared (read-only)
+        self.message = MappingProxyType({
+            'type': _SOURCE_TYPES[source_idx],
+            'key_name': key_name,
+            'midi_value': midi_value,
+            'source_list_name': _SOURCE_NAMES[source_idx]
+        })
+        self._repr = f"KeyMapping(key_name='{key_name}', midi_value=0x{midi_value:02X}, source='{_SOURCE_NAMES[source_idx]}', type='{_SOURCE_TYPES[source_idx]}')"
+    
+    @property
+    def source_list_name(self):
+        """Name of the source list ("pedal_midis", "tab_midis", or "cc_midis")"""
+        return _SOURCE_NAMES[self.source_idx]
     
     def get_midi_type(self):
         """Returns the MIDI message type based on source list"""
-        if self.source_list_name == "cc_midis":
-            return "CC"
-        else:  # pedal_midis or tab_midis
-            return "SysEx"
+        return _SOURCE_TYPES[self.source_idx]
     
     def __repr__(self):
-        return f"KeyMapping(key_name='{self.key_name}', midi_value=0x{self.midi_value:02X}, source='{self.source_list_name}', type='{self.get_midi_type()}')"
+        return self._repr
+
+
+# Number of keys on the deck (key_no 0-14)
+DECK_KEY_COUNT = 15
 
 
 class DeckKeyMappings:
     """Manages mappings for all 15 keys (0-14) in the deck controllers"""
+    __slots__ = ('ketron_midi', '_slots')
     
     def __init__(self, ketron_midi):
         """
@@ -407,7 +563,7 @@ class DeckKeyMappings:
             ketron_midi: Instance of KetronMidi containing pedal_midis, tab_midis, and cc_midis
         """
         self.ketron_midi = ketron_midi
-        self.mappings = {}  # key_no -> KeyMapping
+        self._slots = [None] * DECK_KEY_COUNT  # indexed by key_no -> KeyMapping or None
         
     def set_mapping(self, key_no, key_name, source_list_name):
         """
@@ -416,33 +572,33 @@ class DeckKeyMappings:
         Args:
             key_no: Deck key number (0-14)
             key_name: Key name from the source dictionary
-            source_list_name: "pedal_midis", "tab_midis", or "cc_midis"
+            source_list_name: SourceList member, or "pedal_midis", "tab_midis", or "cc_midis"
         
         Raises:
             ValueError: If key_no is not 0-14 or source_list_name is invalid
             KeyError: If key_name is not found in the specified source list
         """
-        if key_no < 0 or key_no > 14:
+        if not 0 <= key_no < DECK_KEY_COUNT:
             raise ValueError(f"key_no must be between 0 and 14, got {key_no}")
         
         # Get the source list
-        if source_list_name == "pedal_midis":
-            source_list = self.ketron_midi.pedal_midis
-        elif source_list_name == "tab_midis":
-            source_list = self.ketron_midi.tab_midis
-        elif source_list_name == "cc_midis":
-            source_list = self.ketron_midi.cc_midis
+        if isinstance(source_list_name, SourceList):
+            source_idx = source_list_name
         else:
-            raise ValueError(f"Invalid source_list_name: {source_list_name}. Must be 'pedal_midis', 'tab_midis', or 'cc_midis'")
+            try:
+                source_idx = _SOURCE_BY_NAME[source_list_name]
+            except KeyError:
+                raise ValueError(f"Invalid source_list_name: {source_list_name}. Must be 'pedal_midis', 'tab_midis', or 'cc_midis'") from None
+        source_list = _SOURCE_TABLES[source_idx]
         
         # Get the MIDI value
-        if key_name not in source_list:
-            raise KeyError(f"Key '{key_name}' not found in {source_list_name}")
-        
-        midi_value = source_list[key_name]
+        try:
+            midi_value = source_list[key_name]
+        except KeyError:
+            raise KeyError(f"Key '{key_name}' not found in {_SOURCE_NAMES[source_idx]}") from None
         
         # Create and store the mapping
-        self.mappings[key_no] = KeyMapping(key_name, midi_value, source_list_name, source_list)
+        self._slots[key_no] = KeyMapping(key_name, midi_value, source_idx, source_list)
     
     def get_mapping(self, key_no):
         """
@@ -454,7 +610,9 @@ class DeckKeyMappings:
         Returns:
             KeyMapping object or None if not set
         """
-        return self.mappings.get(key_no)
+        if 0 <= key_no < DECK_KEY_COUNT:
+            return self._slots[key_no]
+        return None
     
     def get_midi_message(self, key_no):
         """
@@ -464,31 +622,26 @@ class DeckKeyMappings:
             key_no: Deck key number (0-14)
         
         Returns:
-            dict with keys: 'type' (CC or SysEx), 'key_name', 'midi_value', 'source_list_name'
-            or None if mapping not set
+            Read-only mapping with keys: 'type' (CC or SysEx), 'key_name', 'midi_value',
+            'source_list_name', or None if mapping not set
         """
         mapping = self.get_mapping(key_no)
         if mapping is None:
             return None
         
-        return {
-            'type': mapping.get_midi_type(),
-            'key_name': mapping.key_name,
-            'midi_value': mapping.midi_value,
-            'source_list_name': mapping.source_list_name
-        }
+        return mapping.message
     
     def get_all_mappings(self):
         """Get all mappings as a dictionary"""
-        return self.mappings.copy()
+        return {key_no: mapping for key_no, mapping in enumerate(self._slots) if mapping is not None}
     
     def clear_mapping(self, key_no):
         """Clear the mapping for a key"""
-        if key_no in self.mappings:
-            del self.mappings[key_no]
+        if 0 <= key_no < DECK_KEY_COUNT:
+            self._slots[key_no] = None
     
     def clear_all(self):
         """Clear all mappings"""
-        self.mappings.clear()
+        self._slots[:] = [None] * DECK_KEY_COUNT
 
 
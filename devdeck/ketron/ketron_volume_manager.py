@@ -78,6 +78,12 @@ class KetronVolumeManager:
         self.ketron_midi = KetronMidi()
         self.midi_manager = MidiManager()
         
+        # Upper-cased cc_midis key -> the key itself, for case-insensitive lookups
+        # (the first of several keys differing only by case wins, as the old scan did)
+        self._cc_keys_by_upper = {}
+        for cc_key in self.ketron_midi.cc_midis:
+            self._cc_keys_by_upper.setdefault(cc_key.upper(), cc_key)
+        
         # Mapping from cc_midis key_name to volume variable name
         # Note: Keys should be uppercase since lookup uses key_name.upper()
         self._key_name_to_volume = {
@@ -132,7 +138,7 @@ class KetronVolumeManager:
         with self._volume_lock:
             self._last_pressed_key_name = key_name
         if key_name:
-            self.__logger.debug(f"Set last pressed key_name to: {key_name}")
+            self.__logger.debug("Set last pressed key_name to: %s", key_name)
         else:
             self.__logger.debug("Cleared last pressed key_name")
     
@@ -225,14 +231,10 @@ class KetronVolumeManager:
             return False
         
         # Look up the key_name in cc_midis (case-insensitive)
-        matched_key = None
-        for cc_key in self.ketron_midi.cc_midis.keys():
-            if cc_key.upper() == key_name.upper():
-                matched_key = cc_key
-                break
+        matched_key = self._cc_keys_by_upper.get(key_name.upper())
         
         if matched_key is None:
-            self.__logger.warning(f"Key name '{key_name}' not found in cc_midis, cannot send MIDI CC")
+            self.__logger.warning("Key name '%s' not found in cc_midis, cannot send MIDI CC", key_name)
             return False
         
         # Get the CC control number
@@ -243,8 +245,8 @@ class KetronVolumeManager:
         expected_volume_name = self._key_name_to_volume.get(matched_key.upper())
         if expected_volume_name != volume_name:
             self.__logger.warning(
-                f"Key name '{matched_key}' maps to volume '{expected_volume_name}', "
-                f"but trying to update '{volume_name}'. MIDI CC may be incorrect."
+                "Key name '%s' maps to volume '%s', but trying to update '%s'. MIDI CC may be incorrect.",
+                matched_key, expected_volume_name, volume_name
             )
         
         # All MIDI CC volume commands are sent on the configured MIDI output channel
@@ -257,9 +259,8 @@ class KetronVolumeManager:
         
         if success:
             self.__logger.info(
-                f"Sent MIDI CC: control={cc_control} (0x{cc_control:02X}), "
-                f"value={volume_value}, channel={self.midi_out_channel} "
-                f"for key_name='{matched_key}' -> volume='{volume_name}'"
+                "Sent MIDI CC: control=%s (0x%02X), value=%s, channel=%s for key_name='%s' -> volume='%s'",
+                cc_control, cc_control, volume_value, midi_channel + 1, matched_key, volume_name
             )
         else:
             # Check if mido is available - if not, this is expected in test environments
@@ -272,14 +273,14 @@ class KetronVolumeManager:
             if not mido_available:
                 # mido not installed - this is expected in test environments, use debug level
                 self.__logger.debug(
-                    f"MIDI CC not sent (mido library not available): control={cc_control}, "
-                    f"value={volume_value}, channel={self.midi_out_channel} for key_name='{matched_key}'"
+                    "MIDI CC not sent (mido library not available): control=%s, value=%s, channel=%s for key_name='%s'",
+                    cc_control, volume_value, self.midi_out_channel, matched_key
                 )
             else:
                 # mido is available but send failed - this is a real error
                 self.__logger.error(
-                    f"Failed to send MIDI CC: control={cc_control}, value={volume_value}, "
-                    f"channel={self.midi_out_channel} for key_name='{matched_key}'"
+                    "Failed to send MIDI CC: control=%s, value=%s, channel=%s for key_name='%s'",
+                    cc_control, volume_value, self.midi_out_channel, matched_key
                 )
         
         return success
@@ -289,7 +290,7 @@ class KetronVolumeManager:
         value = self._clamp_volume(value)
         with self._volume_lock:
             setattr(self, f"_{volume_name}", value)
-        self.__logger.debug(f"Set {volume_name} volume to {value}")
+        self.__logger.debug("Set %s volume to %s", volume_name, value)
     
     def _get_volume(self, volume_name: str) -> int:
         """Internal method to get a volume value"""
@@ -807,8 +808,8 @@ class KetronVolumeManager:
         
         if success:
             self.__logger.info(
-                f"Sent Master Volume Expression CC: control={expression_cc} (0x{expression_cc:02X}), "
-                f"value={volume_value}, channel={self.midi_out_channel}"
+                "Sent Master Volume Expression CC: control=%s (0x%02X), value=%s, channel=%s",
+                expression_cc, expression_cc, volume_value, midi_channel + 1
             )
         else:
             # Check if mido is available - if not, this is expected in test environments
@@ -821,14 +822,14 @@ class KetronVolumeManager:
             if not mido_available:
                 # mido not installed - this is expected in test environments, use debug level
                 self.__logger.debug(
-                    f"Master Volume Expression CC not sent (mido library not available): control={expression_cc}, "
-                    f"value={volume_value}, channel={self.midi_out_channel}"
+                    "Master Volume Expression CC not sent (mido library not available): control=%s, value=%s, channel=%s",
+                    expression_cc, volume_value, self.midi_out_channel
                 )
             else:
                 # mido is available but send failed - this is a real error
                 self.__logger.error(
-                    f"Failed to send Master Volume Expression CC: control={expression_cc}, value={volume_value}, "
-                    f"channel={self.midi_out_channel}"
+                    "Failed to send Master Volume Expression CC: control=%s, value=%s, channel=%s",
+                    expression_cc, volume_value, self.midi_out_channel
                 )
         
         return success
@@ -909,7 +910,7 @@ class KetronVolumeManager:
         # Map key_name to volume variable name
         volume_name = self._key_name_to_volume.get(key_name.upper())
         if not volume_name:
-            self.__logger.warning(f"Key name '{key_name}' does not map to a volume variable")
+            self.__logger.warning("Key name '%s' does not map to a volume variable", key_name)
             return None
         
         # Special handling for master volume (uses Expression CC instead of regular CC)
@@ -922,7 +923,7 @@ class KetronVolumeManager:
             method = getattr(self, method_name)
             return method(amount, port_name)
         else:
-            self.__logger.error(f"Increment method '{method_name}' not found for volume '{volume_name}'")
+            self.__logger.error("Increment method '%s' not found for volume '%s'", method_name, volume_name)
             return None
     
     def decrement_last_pressed_volume(self, amount: int = 1, port_name: Optional[str] = None) -> Optional[int]:
@@ -944,7 +945,7 @@ class KetronVolumeManager:
         # Map key_name to volume variable name
         volume_name = self._key_name_to_volume.get(key_name.upper())
         if not volume_name:
-            self.__logger.warning(f"Key name '{key_name}' does not map to a volume variable")
+            self.__logger.warning("Key name '%s' does not map to a volume variable", key_name)
             return None
         
         # Special handling for master volume (uses Expression CC instead of regular CC)
@@ -957,7 +958,7 @@ class KetronVolumeManager:
             method = getattr(self, method_name)
             return method(amount, port_name)
         else:
-            self.__logger.error(f"Decrement method '{method_name}' not found for volume '{volume_name}'")
+            self.__logger.error("Decrement method '%s' not found for volume '%s'", method_name, volume_name)
             return None
     
     def toggle_mute_last_pressed_volume(self, port_name: Optional[str] = None) -> Optional[int]:
@@ -980,7 +981,7 @@ class KetronVolumeManager:
         # Map key_name to volume variable name
         volume_name = self._key_name_to_volume.get(key_name.upper())
         if not volume_name:
-            self.__logger.warning(f"Key name '{key_name}' does not map to a volume variable")
+            self.__logger.warning("Key name '%s' does not map to a volume variable", key_name)
             return None
         
         # Get current volume
@@ -996,7 +997,7 @@ class KetronVolumeManager:
                 self._send_master_expression_cc(new_volume, port_name)
             else:
                 self._send_midi_cc_for_volume(volume_name, new_volume, port_name)
-            self.__logger.info(f"Unmuted {volume_name} (restored to {new_volume})")
+            self.__logger.info("Unmuted %s (restored to %s)", volume_name, new_volume)
         else:
             # Mute (set to 0)
             new_volume = 0
@@ -1006,7 +1007,7 @@ class KetronVolumeManager:
                 self._send_master_expression_cc(new_volume, port_name)
             else:
                 self._send_midi_cc_for_volume(volume_name, new_volume, port_name)
-            self.__logger.info(f"Muted {volume_name} (set to {new_volume})")
+            self.__logger.info("Muted %s (set to %s)", volume_name, new_volume)
         
         return new_volume
 
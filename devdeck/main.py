@@ -24,28 +24,31 @@ def main() -> None:
     root = logging.getLogger('devdeck')
     root.setLevel(logging.DEBUG)
 
-    # Formatter with milliseconds (default %(asctime)s includes milliseconds: YYYY-MM-DD HH:MM:SS,mmm)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-    info_handler = logging.StreamHandler(sys.stdout)
-    info_handler.setLevel(logging.DEBUG)  # Changed to DEBUG to see debug messages
-    info_handler.setFormatter(formatter)
-    info_handler.addFilter(InfoFilter())
-    root.addHandler(info_handler)
-
-    error_handler = logging.StreamHandler(sys.stderr)
-    error_handler.setLevel(logging.WARNING)
-    error_handler.setFormatter(formatter)
-    root.addHandler(error_handler)
-
-    # Get project root and create logs directory
-    project_root = Path(__file__).parent.parent
-    logs_dir = project_root / 'logs'
-    logs_dir.mkdir(exist_ok=True)
-    log_file = logs_dir / 'devdeck.log'
-    fileHandler = RotatingFileHandler(str(log_file), maxBytes=100000, backupCount=5)
-    fileHandler.setFormatter(formatter)
-    root.addHandler(fileHandler)
+    # The GUI calls main() again each time the application is restarted; the handlers
+    # from the first call are still attached, so only add them once
+    if not root.handlers:
+        # Formatter with milliseconds (default %(asctime)s includes milliseconds: YYYY-MM-DD HH:MM:SS,mmm)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        info_handler = logging.StreamHandler(sys.stdout)
+        info_handler.setLevel(logging.DEBUG)  # Changed to DEBUG to see debug messages
+        info_handler.setFormatter(formatter)
+        info_handler.addFilter(InfoFilter())
+        root.addHandler(info_handler)
+
+        error_handler = logging.StreamHandler(sys.stderr)
+        error_handler.setLevel(logging.WARNING)
+        error_handler.setFormatter(formatter)
+        root.addHandler(error_handler)
+
+        # Get project root and create logs directory
+        project_root = Path(__file__).parent.parent
+        logs_dir = project_root / 'logs'
+        logs_dir.mkdir(exist_ok=True)
+        log_file = logs_dir / 'devdeck.log'
+        fileHandler = RotatingFileHandler(str(log_file), maxBytes=100000, backupCount=5)
+        fileHandler.setFormatter(formatter)
+        root.addHandler(fileHandler)
 
     # Validate required USB devices before proceeding
     root.info("Checking for required USB devices...")
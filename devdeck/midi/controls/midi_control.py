@@ -13,7 +13,7 @@ import time
 from devdeck_core.controls.deck_control import DeckControl
 from devdeck.controls.base_control import BaseDeckControl
 from devdeck.midi import MidiManager
-from devdeck.ketron import COLOR_MAP
+from devdeck.ketron import resolve_color
 
 
 class MidiControl(BaseDeckControl):
@@ -67,15 +67,7 @@ class MidiControl(BaseDeckControl):
             with context.renderer() as r:
                 # Convert color if needed (for custom colors like 'white')
                 if background_color:
-                    standard_colors = {'blue', 'green', 'red', 'yellow', 'orange', 'purple', 'white', 'black', 'grey', 'gray', 'cyan', 'magenta', 'pink', 'brown', 'teal', 'navy', 'maroon', 'lime', 'silver', 'gold', 'lightblue', 'lightgreen', 'lightgray', 'darkblue', 'darkgreen', 'darkred'}
-                    if background_color.lower() not in standard_colors:
-                        # It's a custom color name, check COLOR_MAP
-                        if background_color in COLOR_MAP:
-                            hex_value = COLOR_MAP[background_color]
-                            background_color = f"#{hex_value:06X}"
-                        elif background_color.lower() in COLOR_MAP:
-                            hex_value = COLOR_MAP[background_color.lower()]
-                            background_color = f"#{hex_value:06X}"
+                    background_color = resolve_color(background_color)
                 
                 # If icon is specified, use it
                 if 'icon' in self.settings and self.settings['icon']:
@@ -140,15 +132,7 @@ class MidiControl(BaseDeckControl):
         with self.deck_context() as context:
             with context.renderer() as r:
                 # Convert color if needed
-                standard_colors = {'blue', 'green', 'red', 'yellow', 'orange', 'purple', 'white', 'black', 'grey', 'gray', 'cyan', 'magenta', 'pink', 'brown', 'teal', 'navy', 'maroon', 'lime', 'silver', 'gold', 'lightblue', 'lightgreen', 'lightgray', 'darkblue', 'darkgreen', 'darkred'}
-                bg_color = flash_color
-                if bg_color.lower() not in standard_colors:
-                    if bg_color in COLOR_MAP:
-                        hex_value = COLOR_MAP[bg_color]
-                        bg_color = f"#{hex_value:06X}"
-                    elif bg_color.lower() in COLOR_MAP:
-                        hex_value = COLOR_MAP[bg_color.lower()]
-                        bg_color = f"#{hex_value:06X}"
+                bg_color = resolve_color(flash_color)
                 
                 r.background_color(bg_color)
                 r.text(error_text)\
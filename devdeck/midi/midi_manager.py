@@ -10,7 +10,7 @@ import logging
 import platform
 import re
 import threading
-from typing import Optional, List
+from typing import Optional, List, Sequence
 
 try:
     import mido
@@ -20,6 +20,9 @@ except ImportError:
     Message = None
     MidiFile = None
 
+# "0xNN" text for every byte value, for logging SysEx messages without formatting each byte
+_HEX_BYTES = tuple(f'0x{b:02X}' for b in range(256))
+
 
 class MidiManager:
     """
@@ -53,6 +56,9 @@ class MidiManager:
         self.__logger = logging.getLogger('devdeck')
         self._output_ports = {}
         self._port_lock = threading.Lock()
+        # Bumped by close_port, so callers that remember having opened a port can tell
+        # whether it may since have been closed
+        self._close_count = 0
         self._initialized = True
         
         # Check if mido is available (reference module-level variable)
@@ -349,6 +355,11 @@ class MidiManager:
             self.__logger.error(f"Error in open_port: {e}")
             return False
     
+    @property
+    def close_count(self) -> int:
+        """Number of close_port calls so far"""
+        return self._close_count
+    
     def close_port(self, port_name: Optional[str] = None):
         """
         Close a MIDI output port.
@@ -357,6 +368,7 @@ class MidiManager:
             port_name: Name of the MIDI port to close. If None, closes all ports.
         """
         with self._port_lock:
+            self._close_count += 1
             if port_name is None:
                 # Close all ports
                 for name, port in list(self._output_ports.items()):
@@ -429,12 +441,12 @@ class MidiManager:
             self.__logger.error(f"Error sending CC message: {e}")
             return False
     
-    def send_sysex(self, data: List[int], port_name: Optional[str] = None, skip_log: bool = False) -> bool:
+    def send_sysex(self, data: Sequence[int], port_name: Optional[str] = None, skip_log: bool = False) -> bool:
         """
         Send a MIDI System Exclusive (SysEx) message.
         
         Args:
-            data: List of bytes (0-127) for the SysEx message (excluding 0xF0 and 0xF7)
+            data: List, tuple or bytes (0-127) for the SysEx message (excluding 0xF0 and 0xF7)
             port_name: Name of the MIDI port to use. If None, uses the first open port.
         
         Returns:
@@ -445,7 +457,7 @@ class MidiManager:
             return False
         
         # Validate data
-        if not isinstance(data, list):
+        if not isinstance(data, (list, tuple, bytes)):
             self.__logger.error(f"Invalid SysEx data: must be a list of integers")
             return False
         
@@ -467,9 +479,8 @@ class MidiManager:
             port.send(msg)
             
             # Log exact SysEx message bytes (including F0 and F7) unless skip_log is True
-            if not skip_log:
-                sysex_bytes = [0xF0] + data + [0xF7]
-                sysex_hex = ' '.join([f'0x{b:02X}' for b in sysex_bytes])
+            if not skip_log and self.__logger.isEnabledFor(logging.INFO):
+                sysex_hex = ' '.join(['0xF0', *map(_HEX_BYTES.__getitem__, data), '0xF7'])
                 self.__logger.info(
                     f"MIDI SysEx: {sysex_hex} ({len(data)} data bytes)"
                 )
@@ -479,12 +490,12 @@ class MidiManager:
             self.__logger.error(f"Error sending SysEx message: {e}")
             return False
     
-    def send_sysex_raw(self, raw_data: List[int], port_name: Optional[str] = None) -> bool:
+    def send_sysex_raw(self, raw_data: Sequence[int], port_name: Optional[str] = None) -> bool:
         """
         Send a raw SysEx message (including 0xF0 and 0xF7).
         
         Args:
-            raw_data: List of bytes including 0xF0 at start and 0xF7 at end
+            raw_data: List, tuple or bytes including 0xF0 at start and 0xF7 at end
             port_name: Name of the MIDI port to use. If None, uses the first open port.
         
         Returns:
@@ -507,10 +518,11 @@ class MidiManager:
         data = raw_data[1:-1]
         
         # Log exact SysEx message bytes before sending
-        sysex_hex = ' '.join([f'0x{b:02X}' for b in raw_data])
-        self.__logger.info(
-            f"MIDI SysEx: {sysex_hex} ({len(data)} data bytes)"
-        )
+        if self.__logger.isEnabledFor(logging.INFO):
+            sysex_hex = ' '.join(map(_HEX_BYTES.__getitem__, raw_data))
+            self.__logger.info(
+                f"MIDI SysEx: {sysex_hex} ({len(data)} data bytes)"
+            )
         
         # Skip logging in send_sysex since we already logged above
         return self.send_sysex(data, port_name, skip_log=True)
@@ -122,7 +122,12 @@ def check_elgato_stream_deck() -> Tuple[bool, Optional[USBDevice]]:
         logger.debug("Windows detected - skipping USB-level Stream Deck check (using library detection)")
         return (True, None)
     
-    devices = get_usb_devices()
+    return _find_elgato_stream_deck(get_usb_devices())
+
+
+def _find_elgato_stream_deck(devices: List[USBDevice]) -> Tuple[bool, Optional[USBDevice]]:
+    """Look for an Elgato Stream Deck in an already enumerated device list."""
+    logger = logging.getLogger('devdeck')
     
     # Log all detected USB devices for debugging
     if devices:
@@ -167,7 +172,12 @@ def check_midi_output_device() -> Tuple[bool, Optional[USBDevice]]:
         logger.debug("Windows detected - skipping USB-level MIDI check (using port enumeration)")
         return (True, None)
     
-    devices = get_usb_devices()
+    return _find_midi_output_device(get_usb_devices())
+
+
+def _find_midi_output_device(devices: List[USBDevice]) -> Tuple[bool, Optional[USBDevice]]:
+    """Look for a MIDI output device in an already enumerated device list."""
+    logger = logging.getLogger('devdeck')
     
     # Known MIDI-related vendor IDs (excluding CH345 and Ketron which are checked separately)
     midi_vendor_ids = {
@@ -207,6 +217,23 @@ def check_midi_output_device() -> Tuple[bool, Optional[USBDevice]]:
     return (False, None)
 
 
+def scan_usb_once() -> Tuple[Tuple[bool, Optional[USBDevice]], Tuple[bool, Optional[USBDevice]]]:
+    """
+    Check for both the Stream Deck and a MIDI output device with a single
+    USB enumeration.
+    
+    Returns:
+        Tuple of (elgato_result, midi_result), each in the same form as
+        check_elgato_stream_deck() and check_midi_output_device().
+    """
+    if platform.system() == 'Windows':
+        logging.getLogger('devdeck').debug("Windows detected - skipping USB-level device checks")
+        return ((True, None), (True, None))
+    
+    devices = get_usb_devices()
+    return (_find_elgato_stream_deck(devices), _find_midi_output_device(devices))
+
+
 def check_midi_input_device() -> Tuple[bool, Optional[USBDevice]]:
     """
     Check if a MIDI input USB device is connected.
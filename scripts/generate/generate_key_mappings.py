@@ -18,11 +18,8 @@ from devdeck.ketron import KetronMidi
 
 def generate_random_mappings():
     """Generate random mappings for all 30 keys"""
-    # Create a minimal KetronMidi instance without calling _build_cache
-    ketron = KetronMidi.__new__(KetronMidi)
-    ketron.pedal_midis = ketron._init_pedal_midis()
-    ketron.tab_midis = ketron._init_tab_midis()
-    ketron.cc_midis = ketron._init_cc_midis()
+    # The lookup tables are module constants, so construction is cheap
+    ketron = KetronMidi()
     
     # Get all available keys from each list
     pedal_keys = list(ketron.pedal_midis.keys())
@@ -0,0 +1,89 @@
+"""
+Test loading and caching of key_mappings.json by KetronKeyMappingControl.
+
+Usage:
+    python -m pytest tests/devdeck/ketron/test_ketron_key_mappings.py
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path to allow imports
+# Path is now: tests/devdeck/ketron/test_ketron_key_mappings.py
+# Need to go up 4 levels to get to project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+pytest.importorskip("devdeck_core")
+
+from devdeck.ketron.controls.ketron_key_mapping_control import KetronKeyMappingControl
+
+
+def write_mappings(path, mappings, mtime_ns=None):
+    """Write a key_mappings.json file, optionally setting its modification time"""
+    path.write_text(json.dumps({"key_mappings": mappings}), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+MAPPINGS = [
+    {"key_no": 0, "key_name": "Start/Stop", "source_list_name": "pedal_midis"},
+    {"key_no": 1, "key_name": "START_STOP", "source_list_name": "tab_midis",
+     "text_color": "yellow", "background_color": "blue"},
+]
+
+
+class TestKetronKeyMappings:
+    def test_load(self, tmp_path):
+        path = tmp_path / 'key_mappings.json'
+        write_mappings(path, MAPPINGS)
+
+        mappings = KetronKeyMappingControl._load_key_mappings(str(path))
+
+        assert sorted(mappings) == [0, 1]
+        assert mappings[0].key_name == "Start/Stop"
+        assert mappings[0].text_color == "white"
+        assert mappings[1].source_list_name == "tab_midis"
+        assert mappings[1].background_color == "blue"
+
+    def test_unchanged_file_keeps_entries(self, tmp_path, monkeypatch):
+        path = tmp_path / 'key_mappings.json'
+        write_mappings(path, MAPPINGS)
+        first = KetronKeyMappingControl._load_key_mappings(str(path))
+
+        # Check the file on every load rather than trusting the cache for a while
+        monkeypatch.setattr(KetronKeyMappingControl, 'KEY_MAPPINGS_CHECK_TTL', 0)
+        second = KetronKeyMappingControl._load_key_mappings(str(path))
+
+        assert second is first
+        assert second[0] is first[0]
+
+    def test_changed_file_is_reloaded(self, tmp_path, monkeypatch):
+        path = tmp_path / 'key_mappings.json'
+        write_mappings(path, MAPPINGS, mtime_ns=1_000_000_000)
+        first = KetronKeyMappingControl._load_key_mappings(str(path))
+
+        monkeypatch.setattr(KetronKeyMappingControl, 'KEY_MAPPINGS_CHECK_TTL', 0)
+        changed = [dict(MAPPINGS[0]), dict(MAPPINGS[1], key_name="TEMPO_FAST")]
+        write_mappings(path, changed, mtime_ns=2_000_000_000)
+        second = KetronKeyMappingControl._load_key_mappings(str(path))
+
+        assert second is not first
+        assert second[1].key_name == "TEMPO_FAST"
+        # Entries for keys that didn't change are reused
+        assert second[0] is first[0]
+
+    def test_bad_key_name_is_skipped(self, tmp_path):
+        path = tmp_path / 'key_mappings.json'
+        write_mappings(path, [
+            {"key_no": 0, "key_name": 5, "source_list_name": "pedal_midis"},
+            {"key_no": 1, "key_name": "START_STOP", "source_list_name": "tab_midis"},
+        ])
+
+        mappings = KetronKeyMappingControl._load_key_mappings(str(path))
+
+        assert sorted(mappings) == [1]
+        assert mappings[1].key_name == "START_STOP"
@@ -0,0 +1,66 @@
+"""
+Test the Ketron pedal/tab SysEx messages that KetronMidi prebuilds at import.
+
+Usage:
+    python -m pytest tests/devdeck/ketron/test_ketron_sysex_tables.py
+"""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Add project root to path to allow imports
+# Path is now: tests/devdeck/ketron/test_ketron_sysex_tables.py
+# Need to go up 4 levels to get to project root
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from devdeck.ketron import KetronMidi
+from devdeck.ketron import ketron
+
+
+class TestKetronSysexTables:
+    def test_pedal_messages(self):
+        midi = KetronMidi()
+        assert midi.format_pedal_sysex("Start/Stop") == bytes([0x26, 0x79, 0x03, 0x12, 0x7F])
+        assert midi.format_pedal_sysex("Start/Stop", on_state=False) == bytes([0x26, 0x79, 0x03, 0x12, 0x00])
+        # Values >= 128 use the extended format with the value split into two 7-bit bytes
+        assert midi.format_pedal_sysex("TAP") == bytes([0x26, 0x79, 0x05, 0x01, 0x08, 0x7F])
+
+    def test_tab_messages(self):
+        midi = KetronMidi()
+        assert midi.format_tab_sysex("START_STOP") == bytes([0x26, 0x7C, 0x4D, 0x7F])
+        assert midi.format_tab_sysex("START_STOP", on_state=False) == bytes([0x26, 0x7C, 0x4D, 0x00])
+
+    def test_every_message_matches_the_builders(self):
+        for name, value in ketron._PEDAL_MIDIS.items():
+            on = ketron._build_pedal_sysex(value, ketron.KETRON_SYSEX_ON_VALUE)
+            off = ketron._build_pedal_sysex(value, ketron.KETRON_SYSEX_OFF_VALUE)
+            assert ketron._PEDAL_SYSEX_ON_RAW[name] == b'\xF0' + on + b'\xF7'
+            assert ketron._PEDAL_SYSEX_OFF_RAW[name] == b'\xF0' + off + b'\xF7'
+        for name, value in ketron._TAB_MIDIS.items():
+            on = ketron._build_tab_sysex(value, ketron.KETRON_SYSEX_ON_VALUE)
+            off = ketron._build_tab_sysex(value, ketron.KETRON_SYSEX_OFF_VALUE)
+            assert ketron._TAB_SYSEX_ON_RAW[name] == b'\xF0' + on + b'\xF7'
+            assert ketron._TAB_SYSEX_OFF_RAW[name] == b'\xF0' + off + b'\xF7'
+
+    def test_unknown_name_raises_key_error(self):
+        midi = KetronMidi()
+        with pytest.raises(KeyError):
+            midi.format_pedal_sysex("No Such Pedal")
+
+    def test_send_sends_framed_on_then_off(self):
+        midi = KetronMidi()
+        midi._midi = mock.Mock()
+        midi._midi.is_port_open.return_value = True
+        midi._midi.send_sysex_raw.return_value = True
+
+        # A long delay leaves the OFF message pending until flush() sends it
+        assert midi.send_pedal_command("Start/Stop", "port", delay=60)
+        midi.flush()
+
+        assert midi._midi.send_sysex_raw.call_args_list == [
+            mock.call(bytes.fromhex('f0267903127ff7'), "port"),
+            mock.call(bytes.fromhex('f02679031200f7'), "port"),
+        ]